@@ -2,35 +2,263 @@ import sqlite3
 import logging
 import os
 import glob
-from datetime import datetime
+import atexit
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Iterator
 
-from opgg.champion import Champion, Passive, Skin, Spell
+import orjson
+
+from opgg.champion import Champion, Passive, Price, Skin, Spell
 from opgg.season import SeasonInfo
 
 
+_logger = logging.getLogger("OPGG.py")
+
+
+# Applied to every connection as it's opened (see Cacher._configure). WAL + synchronous=NORMAL drop the fsync
+# per commit and let readers work alongside the writer, mmap skips read() syscalls for hot pages.
+_PRAGMA_SQL = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-65536;
+PRAGMA journal_size_limit=67108864;
+"""
+
+# Full cache schema, run as a single script (and transaction) by Cacher.setup()
+_SCHEMA_SQL = """
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS tblSummoners (summoner_name PRIMARY KEY, summoner_id);
+
+-- Covering index for id -> name lookups (get_summoner_name), answered from the index alone instead of a table scan.
+-- (name -> id lookups already use the primary key's unique index)
+CREATE INDEX IF NOT EXISTS idx_summoner_id_name ON tblSummoners (summoner_id, summoner_name);
+
+-- *_list / skin_prices / skin_sales hold orjson encoded arrays (see insert_all_champs)
+CREATE TABLE IF NOT EXISTS tblChampions (
+    champion_id PRIMARY KEY,
+    champion_key,
+    champion_name,
+    champion_image_url,
+    champion_evolve_list BLOB,
+    champion_partype
+);
+
+-- Case-insensitive lookups by name (see get_champ_id_by_name) probe this index instead of scanning the table
+CREATE INDEX IF NOT EXISTS idx_champ_name ON tblChampions (champion_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_champ_key ON tblChampions (champion_key);
+
+CREATE TABLE IF NOT EXISTS tblSeasonInfo (
+    season_id PRIMARY KEY,
+    season_value,
+    season_display_name,
+    season_split,
+    season_is_preseason
+);
+
+CREATE TABLE IF NOT EXISTS tblPassives (
+    champion_id PRIMARY KEY,
+    passive_name,
+    passive_description,
+    passive_image_url,
+    passive_video_url
+);
+
+-- Spell names (and keys) repeat across champions, so a spell is identified by its champion and key together
+CREATE TABLE IF NOT EXISTS tblSpells (
+    champion_id,
+    spell_key,
+    spell_name,
+    spell_description,
+    spell_max_rank,
+    spell_range_burn_list BLOB,
+    spell_cooldown_burn_list BLOB,
+    spell_cooldown_burn_float_list BLOB,
+    spell_cost_burn_list BLOB,
+    spell_tooltip,
+    spell_image_url,
+    spell_video_url,
+    PRIMARY KEY (champion_id, spell_key)
+);
+
+CREATE TABLE IF NOT EXISTS tblSkins (
+    champion_id,
+    skin_id PRIMARY KEY,
+    skin_name,
+    skin_centered_image,
+    skin_video_url,
+    skin_prices BLOB,
+    skin_sales BLOB,
+    skin_release_date
+);
+
+-- get_skins looks rows up by champion_id, which isn't part of the primary key. (get_spells probes the primary key)
+CREATE INDEX IF NOT EXISTS idx_skins_champ ON tblSkins (champion_id);
+
+-- One serialized champion (Champion.to_dict) per row, so a cached champion comes back from a single primary key read
+CREATE TABLE IF NOT EXISTS tblChampionBlob (champion_id PRIMARY KEY, json BLOB, fetched_at INTEGER);
+
+COMMIT;
+"""
+
+
+# Fixed statements, kept as constants so every call passes the exact same SQL text and hits the connection's
+# prepared statement cache (see connect) instead of going through SQLite's parser again.
+_UPSERT_SUMMONERS_SQL = """
+INSERT INTO tblSummoners (summoner_name, summoner_id)
+VALUES (?, ?)
+ON CONFLICT(summoner_name) DO UPDATE SET summoner_id = excluded.summoner_id
+WHERE tblSummoners.summoner_id IS NOT excluded.summoner_id;
+"""
+_INSERT_SUMMONER_SQL = "INSERT OR IGNORE INTO tblSummoners (summoner_name, summoner_id) VALUES (?, ?);"
+_SELECT_SUMMONER_ID_SQL = "SELECT summoner_id FROM tblSummoners WHERE summoner_name = ?;"
+_SELECT_SUMMONER_NAME_SQL = "SELECT summoner_name FROM tblSummoners WHERE summoner_id = ?;"
+
+_SELECT_CHAMPION_BLOBS_SQL = "SELECT json FROM tblChampionBlob;"
+_SELECT_CHAMPION_BLOB_SQL = "SELECT json FROM tblChampionBlob WHERE champion_id = ?;"
+_SELECT_CHAMPIONS_SQL = "SELECT * FROM tblChampions;"
+_SELECT_CHAMPION_ID_SQL = "SELECT champion_id FROM tblChampions WHERE champion_name = ? COLLATE NOCASE LIMIT 1;"
+_SELECT_PASSIVES_SQL = "SELECT * FROM tblPassives;"
+_SELECT_PASSIVE_SQL = "SELECT * FROM tblPassives WHERE champion_id = ?;"
+_SELECT_SPELLS_SQL = "SELECT * FROM tblSpells;"
+# the primary key index would hand spells back sorted by key, rowid keeps them in their Q/W/E/R insert order
+_SELECT_CHAMPION_SPELLS_SQL = "SELECT * FROM tblSpells WHERE champion_id = ? ORDER BY rowid;"
+_SELECT_SKINS_SQL = "SELECT * FROM tblSkins;"
+_SELECT_CHAMPION_SKINS_SQL = "SELECT * FROM tblSkins WHERE champion_id = ?;"
+_SELECT_SEASONS_SQL = "SELECT * FROM tblSeasonInfo;"
+_SPELLS_TABLE_INFO_SQL = "PRAGMA table_info(tblSpells);"
+
+# Names looked up per get_summoner_ids query, below SQLite's host parameter limit (999 on older builds)
+_SUMMONER_IDS_CHUNK = 512
+
+
+@lru_cache(maxsize=None)
+def _bulk_insert_sql(table: str, columns: tuple[str, ...], on_conflict: str) -> str:
+    """
+    `INSERT OR <on_conflict>` statement for `Cacher.bulk_insert`, built once per table/columns.
+    """
+    return f"INSERT OR {on_conflict} INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))});"
+
+
+@lru_cache(maxsize=None)
+def _select_summoner_ids_sql(count: int) -> str:
+    """
+    `SELECT ... WHERE summoner_name IN (?, ...)` statement for `Cacher.get_summoner_ids`, built once per placeholder count.
+    """
+    return f"SELECT summoner_name, summoner_id FROM tblSummoners WHERE summoner_name IN ({', '.join('?' * count)});"
+
+
+@lru_cache(maxsize=None)
+def _bulk_upsert_sql(table: str, columns: tuple[str, ...], conflict: tuple[str, ...]) -> str:
+    """
+    `INSERT ... ON CONFLICT DO UPDATE` statement for `Cacher.bulk_upsert`, built once per table/columns.
+    """
+    updated = [column for column in columns if column not in conflict]
+    
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+        f"ON CONFLICT({', '.join(conflict)}) DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in updated)} "
+        f"WHERE {' OR '.join(f'{table}.{c} IS NOT excluded.{c}' for c in updated)};"
+    )
+
+
+@lru_cache(maxsize=1)
+def _daily_db_path(day: date) -> str:
+    """
+    Default cache database path for a given day. (Formatted once per calendar day)
+    """
+    return f"./cache/opgg-{day.isoformat()}.db"
+
+
+# Set up Cacher instances handed out by Cacher.shared(), keyed by the db_path they were requested for.
+# Only the current day's default database is kept, the previous day's one is closed and dropped on rollover.
+_shared_cachers: dict[str, "Cacher"] = {}
+_shared_default_path: str | None = None
+_shared_cachers_lock = threading.Lock()
+
+
 class Cacher:
     """
     Cacher class for caching summoners, champions, and seasons.
     
     ### Properties:
         `db_path` - Path to the database file.\n
-        `logger` - Logger instance.
+        `logger` - Logger instance.\n
+        `conn` - The calling thread's database connection, shared by all methods. (Opened on first use)
     """
-    def __init__(self, db_path = f'./cache/opgg-{datetime.now().strftime("%Y-%m-%d")}.db'):
-        self.db_path = db_path
-        self.logger = logging.getLogger("OPGG.py")
+    def __init__(self, db_path: str | None = None):
+        # resolved per instance (not in the signature), so a long running process picks up the new day's cache
+        self.db_path = db_path or _daily_db_path(date.today())
+        self.logger = _logger
+        
+        # One connection per thread (see connect), every one of them is tracked so close() can release them all
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        
+        # Background summoner writes (see queue_summoners), the writer thread is started on first use.
+        # (A None item tells it to stop, see close)
+        self._write_queue: queue.Queue[list[tuple[str, str]] | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        self._flush_at_exit = False
+    
+    
+    @classmethod
+    def shared(cls, db_path: str | None = None) -> "Cacher":
+        """
+        Returns the process wide `Cacher` for `db_path`, creating and `setup()`-ing it on first use.\n
+        Every later call (e.g. every new `OPGG` object) reuses it, skipping the cache file checks and schema script.
+        
+        ### Args:
+            db_path : `str`, optional
+                Path to the database file. Defaults to today's cache database. (So a new day gets a fresh setup, 
+                and the previous day's shared cacher is closed)
+        
+        ### Returns:
+            `Cacher` : The shared, set up cacher.
+        """
+        global _shared_default_path
+        
+        stale = None
+        daily = db_path is None
+        db_path = db_path or _daily_db_path(date.today())
+        
+        with _shared_cachers_lock:
+            cacher = _shared_cachers.get(db_path)
+            
+            if cacher is None:
+                cacher = cls(db_path)
+                cacher.setup()
+                _shared_cachers[db_path] = cacher
+            
+            if daily and _shared_default_path != db_path:
+                if _shared_default_path is not None:
+                    stale = _shared_cachers.pop(_shared_default_path, None)
+                _shared_default_path = db_path
+        
+        # outside the lock, closing waits for the old writer to drain its queue
+        if stale is not None:
+            stale.close()
+        
+        return cacher
     
     
     def setup(self) -> None:
         """
         Sets up the cache database and table(s). 
         
-        Runs at OPGG object creation.
+        Runs the first time `Cacher.shared()` hands out this database. (i.e. at the first OPGG object creation)
         """
-        if not os.path.exists('./cache'):
-            self.logger.info("Creating cache directory...")
-            os.mkdir('./cache')
-            self.logger.info("Setting up cache database...")
+        _logger.info("Setting up cache database...")
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
         
         # Do all this cleanup and verification in the connect function to minimize work required
         # to enforce this. Anytime a function needs to connect to the database, this check should
@@ -44,17 +272,18 @@ class Cacher:
             old_path = cache_db[0]
             cache_last_updated = datetime.strptime(old_path.split("-", 1)[-1].replace(".db", ""), "%Y-%m-%d")
             
-            self.logger.info(f"Cache found! Was last built: {cache_last_updated}")
+            _logger.info("Cache found! Was last built: %s", cache_last_updated)
             
             if (datetime.now() - cache_last_updated).days >= 7:
-                self.logger.info("Cache is older than 1 week, rebuilding...")
+                _logger.info("Cache is older than 1 week, rebuilding...")
                 
                 # set db_path to the old cache for a second
                 new_path = self.db_path
                 
-                self.logger.info("Deleting old cache data...")
+                _logger.info("Deleting old cache data...")
                 self.db_path = old_path
                 self.drop_tables([
+                    "tblChampionBlob",
                     "tblChampions",
                     "tblPassives",
                     "tblSeasonInfo",
@@ -62,105 +291,90 @@ class Cacher:
                     "tblSpells",
                 ])
                 
-                self.logger.info(f"Updating filename with current date {old_path} -> {new_path}")
+                # The open connection still points at the old file, release it before renaming
+                self.close()
+                
+                _logger.info("Updating filename with current date %s -> %s", old_path, new_path)
                 os.rename(old_path, new_path)
                 self.db_path = new_path
                 
-                self.logger.info("Cache has been rebuilt! The immediate request following a cache rebuild might take slightly longer as new data is fetched and the cache is updated.")
+                _logger.info("Cache has been rebuilt! The immediate request following a cache rebuild might take slightly longer as new data is fetched and the cache is updated.")
                 
         elif (len(cache_db) > 0):
             os.remove(cache_db[0])
         
-        self.conn = self.connect()
-        self.cursor = self.conn.cursor()
-        
-        # Create summoner table if it doesn't exist
-        self.logger.debug("Creating summoner table if it doesn't exist...")
-        self.cursor.execute("""CREATE TABLE IF NOT EXISTS tblSummoners (summoner_name PRIMARY KEY, summoner_id);""")
-        
-        # Create champions table if it doesn't exist
-        self.logger.debug("Creating champions table if it doesn't exist...")
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tblChampions (
-                champion_id PRIMARY KEY,
-                champion_key,
-                champion_name,
-                champion_image_url,
-                champion_evolve_list,
-                champion_partype
-            );
-            """
-        )
+        # Caches built before spells were keyed by (champion_id, spell_key) lost every spell sharing a name with
+        # another champion's, drop the champion tables so they're refetched whole under the new schema
+        spells_pk = [
+            column[1] for column in sorted(self.connect().execute(_SPELLS_TABLE_INFO_SQL), key=lambda c: c[5]) if column[5]
+        ]
+        if spells_pk == ["spell_name"]:
+            _logger.info("Migrating cached spells to the (champion_id, spell_key) primary key...")
+            self.drop_tables(["tblChampionBlob", "tblChampions", "tblPassives", "tblSkins", "tblSpells"])
+        
+        # Create every table (and index) that doesn't exist yet, in one script / transaction
+        _logger.debug("Creating cache tables if they don't exist...")
+        self.connect().executescript(_SCHEMA_SQL)
+    
+    
+    def bulk_insert(self, table: str, columns: tuple[str, ...], rows: list[tuple], on_conflict: str = "REPLACE") -> int:
+        """
+        Inserts many rows into a table with a single `executemany`, inside one transaction. 
+        (Joins the caller's transaction, if one is already open)
         
-        # Create seasons table if it doesn't exist
-        self.logger.debug("Creating seasons table if it doesn't exist...")
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tblSeasonInfo (
-                season_id PRIMARY KEY,
-                season_value,
-                season_display_name,
-                season_split,
-                season_is_preseason
-            );
-            """
-        )
+        ### Args:
+            table : `str`
+                Table name.
+            
+            columns : `tuple[str, ...]`
+                Column names, in the same order as each row's values.
+            
+            rows : `list[tuple]`
+                The rows to insert.
+            
+            on_conflict : `str, optional`
+                Conflict resolution for rows that already exist. ("REPLACE", "IGNORE", ...) Defaults to "REPLACE".
         
-        # Create passives table if it doesn't exist
-        self.logger.debug("Creating passives table if it doesn't exist...")
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tblPassives (
-                champion_id PRIMARY KEY,
-                passive_name,
-                passive_description,
-                passive_image_url,
-                passive_video_url
-            );
-            """
-        )
+        ### Returns:
+            `int` : The amount of rows affected.
+        """
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(_bulk_insert_sql(table, tuple(columns), on_conflict), rows)
         
-        # Create spells table if it doesn't exist
-        self.logger.debug("Creating spells table if it doesn't exist...")
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tblSpells (
-                champion_id,
-                spell_key,
-                spell_name PRIMARY KEY,
-                spell_description,
-                spell_max_rank,
-                spell_range_burn_list,
-                spell_cooldown_burn_list,
-                spell_cooldown_burn_float_list,
-                spell_cost_burn_list,
-                spell_tooltip,
-                spell_image_url,
-                spell_video_url
-            );
-            """
-        )
+        _logger.debug("You've made changes to the database. Table: %s | Rows affected: %s", table, cursor.rowcount)
+        return cursor.rowcount
+    
+    
+    def bulk_upsert(self, table: str, columns: tuple[str, ...], rows: list[tuple], conflict: tuple[str, ...]) -> int:
+        """
+        Upserts many rows into a table with a single `executemany`, inside one transaction. 
+        (Joins the caller's transaction, if one is already open)
         
-        # Create skins table if it doesn't exist
-        self.logger.debug("Creating skins table if it doesn't exist...")
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tblSkins (
-                champion_id,
-                skin_id PRIMARY KEY,
-                skin_name,
-                skin_centered_image,
-                skin_video_url,
-                skin_prices,
-                skin_sales,
-                skin_release_date
-            )
-            """
-        )
+        Rows that already exist are updated in place, and only when one of their values actually changed.
         
-        self.conn.commit()
-        self.conn.close()
+        ### Args:
+            table : `str`
+                Table name.
+            
+            columns : `tuple[str, ...]`
+                Column names, in the same order as each row's values.
+            
+            rows : `list[tuple]`
+                The rows to upsert.
+            
+            conflict : `tuple[str, ...]`
+                The primary key (or unique) column(s) that identify an existing row.
+        
+        ### Returns:
+            `int` : The amount of rows affected.
+        """
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(_bulk_upsert_sql(table, tuple(columns), tuple(conflict)), rows)
+        
+        _logger.debug("You've made changes to the database. Table: %s | Rows affected: %s", table, cursor.rowcount)
+        return cursor.rowcount
     
     
     def insert_summoner(self, summoner_name: str, summoner_id: str, return_result: bool = False) -> None | str:
@@ -177,30 +391,129 @@ class Cacher:
         ### Returns:
             `str, optional` : Returns a string with the amount of rows affected if requested.
         """
-        self.conn = self.connect()
-        self.cursor = self.conn.cursor()
+        _logger.debug("Attempting to insert %s into cache database...", summoner_name)
         
-        self.logger.debug(f"Attempting to insert {summoner_name} into cache database...")
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_INSERT_SUMMONER_SQL, (summoner_name, summoner_id))
         
-        self.cursor.execute(
-            """
-            INSERT OR IGNORE INTO tblSummoners (summoner_name, summoner_id)
-            VALUES (?, ?);
-            """, 
-            (summoner_name, summoner_id)
-        )
+        return self._report(f"You have made changes to the database. Table: tblSummoners | Rows affected: {cursor.rowcount}", return_result)
         
-        self.conn.commit()
-        self.conn.close()
         
-        return_msg = f"You have made changes to the database. Table: tblSummoners | Rows affected: {self.cursor.rowcount}"
+    def insert_summoners(self, summoners: list[tuple[str, str]], return_result: bool = False) -> None | str:
+        """
+        Inserts (or refreshes) several summoner name and id pairs in a single statement and transaction.
         
-        if return_result:
-            return return_msg
-        else:
-            self.logger.info(return_msg)
+        ### Args:
+            summoners : `list[tuple[str, str]]`
+                A list of `(summoner_name, summoner_id)` pairs.
         
+        ### Returns:
+            `str, optional` : Returns a string with the amount of rows affected if requested.
+        """
+        _logger.debug("Attempting to insert %s summoners into cache database...", len(summoners))
+        
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(_UPSERT_SUMMONERS_SQL, summoners)
         
+        return self._report(f"You have made changes to the database. Table: tblSummoners | Rows affected: {cursor.rowcount}", return_result)
+    
+    
+    def queue_summoners(self, summoners: list[tuple[str, str]]) -> None:
+        """
+        Queues summoner name and id pairs to be upserted by a background writer thread and returns immediately.
+        
+        Everything queued at the time the writer wakes up is written in one batch/transaction. 
+        Call `flush()` to wait for pending writes. (Also done automatically at interpreter exit)
+        
+        ### Args:
+            summoners : `list[tuple[str, str]]`
+                A list of `(summoner_name, summoner_id)` pairs.
+        """
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._writer_loop, name="OPGG.py-cache-writer", daemon=True)
+                self._writer.start()
+                
+                if not self._flush_at_exit:
+                    self._flush_at_exit = True
+                    atexit.register(self.flush)
+        
+        self._write_queue.put(summoners)
+    
+    
+    def flush(self) -> None:
+        """
+        Blocks until every summoner queued with `queue_summoners()` has been written. (Or dropped, see `_writer_loop`)
+        
+        Returns straight away if the writer thread isn't running, nothing would ever drain the queue.
+        """
+        if self._writer is not None and self._writer.is_alive():
+            self._write_queue.join()
+    
+    
+    def _writer_loop(self) -> None:
+        """
+        Body of the background writer thread. Drains the write queue in batches, one upsert + commit per batch.
+        
+        Uses its own connection, so its transactions never interleave with the caller's. (WAL lets both work at once)
+        
+        If the database can't be opened (unwritable path, locked while applying the PRAGMAs, ...) the batch is logged 
+        and dropped, and opening is retried for the next one. Every item is always marked done, so `flush()` can't hang.
+        Stops (and closes its connection) when `close()` queues the `None` sentinel.
+        """
+        conn = None
+        stopping = False
+        
+        try:
+            while not stopping:
+                batch = [self._write_queue.get()]
+                while True:
+                    try:
+                        batch.append(self._write_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                try:
+                    summoners = [summoner for summoners in batch if summoners is not None for summoner in summoners]
+                    stopping = None in batch
+                    
+                    if not summoners:
+                        continue
+                    
+                    if conn is None:
+                        conn = self._open_writer_conn()
+                    
+                    with self._transaction(conn):
+                        conn.executemany(_UPSERT_SUMMONERS_SQL, summoners)
+                    
+                    _logger.debug("Background writer cached %s summoners.", len(summoners))
+                except sqlite3.Error as e:
+                    _logger.error("Background writer failed to cache summoners: %s", e)
+                finally:
+                    for _ in batch:
+                        self._write_queue.task_done()
+        finally:
+            if conn is not None:
+                conn.close()
+    
+    
+    def _open_writer_conn(self) -> sqlite3.Connection:
+        """
+        Opens and configures the background writer's connection, closing it again if configuring fails.
+        """
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        
+        try:
+            self._configure(conn)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        
+        return conn
+    
+    
     def get_summoner_id(self, summoner_name: str) -> str | None:
         """
         Gets a summoner id from the cache database by a provided summoner name.
@@ -216,28 +529,52 @@ class Cacher:
         ### Returns:
             `str | None` : Returns a `str` with the summoner id, if found. Otherwise returns `None`.
         """
-        self.conn = self.connect()
-        self.cursor = self.conn.cursor()
+        cursor = self.connect().cursor()
         
-        self.logger.info(f"Getting {summoner_name}'s summoner id from cache database...")
+        _logger.info("Getting %s's summoner id from cache database...", summoner_name)
         
-        self.cursor.execute("""
-            SELECT summoner_id
-            FROM tblSummoners
-            WHERE summoner_name = ?;
-        """, (summoner_name,))
+        cursor.execute(_SELECT_SUMMONER_ID_SQL, (summoner_name,))
         
-        result = self.cursor.fetchone()
-        self.conn.close()
+        result = cursor.fetchone()
         
         if result is None:
-            self.logger.info(f"{summoner_name}'s summoner_id not found in cache database.")
+            _logger.info("%s's summoner_id not found in cache database.", summoner_name)
             return None
         
-        self.logger.info(f"{summoner_name}'s summoner_id found in cache database. ({result[0]})")
+        _logger.info("%s's summoner_id found in cache database. (%s)", summoner_name, result[0])
         return result[0]
     
     
+    def get_summoner_ids(self, summoner_names: list[str]) -> dict[str, str | None]:
+        """
+        Gets the summoner ids for several summoner names from the cache database, up to 512 names per query.
+        
+        ### Args:
+            summoner_names : `list[str]`
+                List of summoner names.
+        
+        ### Returns:
+            `dict[str, str | None]` : Returns a `dict` mapping each summoner name to its summoner id, or `None` if it isn't cached.
+        """
+        cursor = self.connect().cursor()
+        
+        _logger.info("Getting summoner ids for %d summoners from cache database...", len(summoner_names))
+        
+        cached_ids = {}
+        for i in range(0, len(summoner_names), _SUMMONER_IDS_CHUNK):
+            chunk = list(summoner_names[i:i + _SUMMONER_IDS_CHUNK])
+            
+            # pad (repeating the last name) up to a power of two, so only a handful of distinct statements ever
+            # end up in the connection's statement cache instead of one per list length
+            count = 1 << (len(chunk) - 1).bit_length()
+            chunk += chunk[-1:] * (count - len(chunk))
+            
+            cached_ids.update(cursor.execute(_select_summoner_ids_sql(count), chunk).fetchall())
+        
+        _logger.info("Found %d/%d summoner ids in cache database.", len(cached_ids), len(summoner_names))
+        return {summoner_name: cached_ids.get(summoner_name) for summoner_name in summoner_names}
+    
+    
     def get_summoner_name(self, summoner_id: str) -> str | None:
         """
         Gets a summoner name from the cache database by a provided summoner id.
@@ -249,25 +586,19 @@ class Cacher:
         ### Returns:
             `str | None` : Returns a `str` with the summoner name, if found. Otherwise returns `None`.
         """
-        self.conn = self.connect()
-        self.cursor = self.conn.cursor()
+        cursor = self.connect().cursor()
         
-        self.logger.info(f"Getting associated summoner name from summoner_id: {summoner_id}...")
+        _logger.info("Getting associated summoner name from summoner_id: %s...", summoner_id)
         
-        self.cursor.execute("""
-            SELECT summoner_name
-            FROM tblSummoners
-            WHERE summoner_id = ?;
-        """, (summoner_id,))
+        cursor.execute(_SELECT_SUMMONER_NAME_SQL, (summoner_id,))
         
-        result = self.cursor.fetchone()
-        self.conn.close()
+        result = cursor.fetchone()
         
         if result is None:
-            self.logger.info(f"Could not find an associated summoner_name for summoner_id: {summoner_id}")
+            _logger.info("Could not find an associated summoner_name for summoner_id: %s", summoner_id)
             return None
         
-        self.logger.info(f"Found associated summoner_name for summoner_id: {summoner_id} ({result[0]})")
+        _logger.info("Found associated summoner_name for summoner_id: %s (%s)", summoner_id, result[0])
         return result[0]
     
     
@@ -282,12 +613,9 @@ class Cacher:
         ### Returns:
             `None` | `str, optional` : Returns a string with the amount of rows affected if requested.
         """
-        self.conn = self.connect()
-        self.cursor = self.conn.cursor()
         total_rc = 0 # total rowcount
-        return_msg = "You've made changes to the database. Table: {table} | Rows affected: {count}"
         
-        self.logger.debug(f"Attempting to insert {len(champions)} champions into cache database...")
+        _logger.debug("Attempting to insert %s champions into cache database...", len(champions))
         
         batch_champion_insert:  list[tuple] = []
         batch_passives_insert:  list[tuple] = []
@@ -301,7 +629,7 @@ class Cacher:
                 champion.key,
                 champion.name,
                 champion.image_url,
-                ','.join([f"{_evolve}" for _evolve in champion.evolve]),
+                orjson.dumps(champion.evolve),
                 champion.partype
             ))
             
@@ -322,10 +650,10 @@ class Cacher:
                     spell.name,
                     spell.description,
                     spell.max_rank,
-                    ','.join([f"{_range}" for _range in spell.range_burn]),
-                    ','.join([f"{_cooldown}" for _cooldown in spell.cooldown_burn]),
-                    ','.join([f"{_cooldown_float}" for _cooldown_float in spell.cooldown_burn_float]),
-                    ','.join([f"{_cost}" for _cost in spell.cost_burn]),
+                    orjson.dumps(spell.range_burn),
+                    orjson.dumps(spell.cooldown_burn),
+                    orjson.dumps(spell.cooldown_burn_float),
+                    orjson.dumps(spell.cost_burn),
                     spell.tooltip,
                     spell.image_url,
                     spell.video_url
@@ -339,68 +667,50 @@ class Cacher:
                     skin.name,
                     skin.centered_image,
                     skin.skin_video_url,
-                    ','.join([f"{price.currency}: {price.cost}" for price in skin.prices]) if skin.prices else None,
-                    skin.release_date,
-                    ','.join([f"{_price}" for _price in skin.prices]) if skin.prices else str(skin.prices)
+                    orjson.dumps([(price.currency, price.cost) for price in skin.prices]) if skin.prices else None,
+                    skin.release_date.isoformat() if isinstance(skin.release_date, datetime) else skin.release_date,
+                    orjson.dumps(skin.sales)
                 ))
         
-        # insert into champion table
-        self.cursor.executemany(
-            """
-            INSERT OR IGNORE INTO tblChampions (champion_id, champion_key, champion_name, champion_image_url, champion_evolve_list, champion_partype)
-            VALUES (:1, :2, :3, :4, :5, :6)
-            """,
-            batch_champion_insert
-        )
-        
-        total_rc += self.cursor.rowcount
-        self.logger.debug(return_msg.format(table="tblChampions", count=self.cursor.rowcount))
-        
-        # insert into passives table
-        self.cursor.executemany(
-            """
-            INSERT OR IGNORE INTO tblPassives (champion_id, passive_name, passive_description, passive_image_url, passive_video_url)
-            VALUES (:1, :2, :3, :4, :5)
-            """,
-            batch_passives_insert
-        )
-        
-        total_rc += self.cursor.rowcount
-        self.logger.debug(return_msg.format(table="tblPassives", count=self.cursor.rowcount))
-        
-        # insert into skins table
-        self.cursor.executemany(
-            """
-            INSERT OR IGNORE INTO tblSkins (champion_id, skin_id, skin_name, skin_centered_image, skin_video_url, skin_prices, skin_release_date, skin_sales)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8)
-            """,
-            batch_skins_insert
-        )
-        
-        total_rc += self.cursor.rowcount
-        self.logger.debug(return_msg.format(table="tblSkins", count=self.cursor.rowcount))
-        
-        # insert into spells table
-        self.cursor.executemany(
-            """
-            INSERT OR IGNORE INTO tblSpells (champion_id, spell_key, spell_name, spell_description, spell_max_rank, spell_range_burn_list, spell_cooldown_burn_list, spell_cooldown_burn_float_list, spell_cost_burn_list, spell_tooltip, spell_image_url, spell_video_url)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12)
-            """,
-            batch_spells_insert
-        )
-        
-        total_rc += self.cursor.rowcount
-        self.logger.debug(return_msg.format(table="tblSpells", count=self.cursor.rowcount))
-        
-        self.conn.commit()
-        self.conn.close()
-        
-        return_msg = f"You've made several changes to the database. Total rows affected: {total_rc}"
+        with self._transaction():
+            total_rc += self.bulk_upsert(
+                "tblChampions",
+                ("champion_id", "champion_key", "champion_name", "champion_image_url", "champion_evolve_list", "champion_partype"),
+                batch_champion_insert,
+                conflict=("champion_id",)
+            )
+            total_rc += self.bulk_upsert(
+                "tblPassives",
+                ("champion_id", "passive_name", "passive_description", "passive_image_url", "passive_video_url"),
+                batch_passives_insert,
+                conflict=("champion_id",)
+            )
+            total_rc += self.bulk_upsert(
+                "tblSkins",
+                ("champion_id", "skin_id", "skin_name", "skin_centered_image", "skin_video_url", "skin_prices", "skin_release_date", "skin_sales"),
+                batch_skins_insert,
+                conflict=("skin_id",)
+            )
+            total_rc += self.bulk_upsert(
+                "tblSpells",
+                (
+                    "champion_id", "spell_key", "spell_name", "spell_description", "spell_max_rank", "spell_range_burn_list",
+                    "spell_cooldown_burn_list", "spell_cooldown_burn_float_list", "spell_cost_burn_list", "spell_tooltip",
+                    "spell_image_url", "spell_video_url"
+                ),
+                batch_spells_insert,
+                conflict=("champion_id", "spell_key")
+            )
+            
+            fetched_at = int(time.time())
+            total_rc += self.bulk_upsert(
+                "tblChampionBlob",
+                ("champion_id", "json", "fetched_at"),
+                [(champion.id, champion.to_json(), fetched_at) for champion in champions],
+                conflict=("champion_id",)
+            )
         
-        if return_result: 
-            return return_msg
-        else:
-            self.logger.info(return_msg)
+        return self._report(f"You've made several changes to the database. Total rows affected: {total_rc}", return_result)
             
             
     def get_all_champs(self) -> list[Champion] | None:
@@ -410,48 +720,116 @@ class Cacher:
         ### Returns:
             `list[Champion]` | `None` : Returns a list of Champion objects if found. Otherwise returns `None`.
         """
-        self.conn = self.connect()
-        self.cursor = self.conn.cursor()
+        cursor = self.connect().cursor()
         all_champs = []
         
-        self.logger.info("Getting all champions from cache database...")
-        self.cursor.execute("SELECT * FROM tblChampions;")
-        result = self.cursor.fetchall()
+        _logger.info("Getting all champions from cache database...")
+        
+        # Fast path: one blob per champion, no joins or per-row object assembly
+        blobs = cursor.execute(_SELECT_CHAMPION_BLOBS_SQL).fetchall()
+        if blobs:
+            _logger.info("Found %d serialized champions in cache database.", len(blobs))
+            return [Champion.from_json(blob[0]) for blob in blobs]
+        
+        cursor.execute(_SELECT_CHAMPIONS_SQL)
+        result = cursor.fetchall()
         
         if result is None:
-            self.logger.error("No champions found in cache database.")
+            _logger.error("No champions found in cache database.")
             raise Exception("Multiple levels of data fetching have failed to result in this event.\n \
                             1. There were no champions returned in the request to opgg (?) See debug logs...\n \
                             2. There were no champions found in the cache database.")
         else:
-            self.logger.info(f"Found {len(result)} champions in cache database.")
+            _logger.info("Found %d champions in cache database.", len(result))
+            
+            # In order to restore a champion object, we need the following:
+            # PASSIVE FROM PASSIVES TABLE
+            # SPELLS FROM SPELLS TABLE
+            # SKINS FROM SKINS TABLE
+            # Read each table once and group by champion_id, rather than 3 queries per champion.
+            passives: dict[int, Passive] = {}
+            spells: dict[int, list[Spell]] = {}
+            skins: dict[int, list[Skin]] = {}
+            
+            for row in cursor.execute(_SELECT_PASSIVES_SQL):
+                passives[row[0]] = self._passive_from_row(row)
+            
+            for row in cursor.execute(_SELECT_SPELLS_SQL):
+                spells.setdefault(row[0], []).append(self._spell_from_row(row))
+            
+            for row in cursor.execute(_SELECT_SKINS_SQL):
+                skins.setdefault(row[0], []).append(self._skin_from_row(row))
+            
             cached_champ: tuple[str, str, str, str, str]
             for i, cached_champ in enumerate(result):
-                # In order to restore a champion object, we need the following:
-                # PASSIVE FROM PASSIVES TABLE
-                # SPELLS FROM SPELLS TABLE
-                # SKINS FROM SKINS TABLE
-                champ_passive = self.get_passive(cached_champ[0])
-                champ_spells = self.get_spells(cached_champ[0])
-                champ_skins = self.get_skins(cached_champ[0])
+                champ_passive = passives.get(cached_champ[0])
+                champ_spells = spells.get(cached_champ[0], [])
+                champ_skins = skins.get(cached_champ[0], [])
                 
                 champ_obj = Champion(
                     id=cached_champ[0],
                     key=cached_champ[1],
                     name=cached_champ[2],
                     image_url=cached_champ[3],
-                    evolve=cached_champ[4].split(',') if cached_champ[4] else None,
+                    evolve=orjson.loads(cached_champ[4]) if cached_champ[4] else None,
                     partype=cached_champ[5],
                     passive=champ_passive,
                     spells=champ_spells,
                     skins=champ_skins
                 )
                 all_champs.append(champ_obj)
-                self.logger.info(f"Successfully rebuilt the \"{champ_obj.name}\" champion object from cache. ({i+1}/{len(result)})")
+                _logger.info("Successfully rebuilt the \"%s\" champion object from cache. (%d/%d)", champ_obj.name, i + 1, len(result))
                 
             return all_champs
                 
             
+    def get_champ(self, champion_id: int) -> Champion | None:
+        """
+        Gets a single champion from the cache database by its champion id.
+        
+        ### Args:
+            champion_id : `int`
+                Champion id.
+        
+        ### Returns:
+            `Champion | None` : Returns the `Champion` object, if found. Otherwise returns `None`.
+        """
+        cursor = self.connect().cursor()
+        
+        _logger.debug("Getting serialized champion for champion_id: %s...", champion_id)
+        
+        cursor.execute(_SELECT_CHAMPION_BLOB_SQL, (champion_id,))
+        result = cursor.fetchone()
+        
+        return Champion.from_json(result[0]) if result else None
+    
+    
+    def get_champ_id_by_name(self, champion_name: str) -> int | None:
+        """
+        Gets a champion id from the cache database by a provided champion name. (Case-insensitive, exact match)
+        
+        ### Args:
+            champion_name : `str`
+                Champion name.
+        
+        ### Returns:
+            `int | None` : Returns an `int` with the champion id, if found. Otherwise returns `None`.
+        """
+        cursor = self.connect().cursor()
+        
+        _logger.debug("Getting champion_id for champion_name: %s...", champion_name)
+        
+        cursor.execute(_SELECT_CHAMPION_ID_SQL, (champion_name,))
+        
+        result = cursor.fetchone()
+        
+        if result is None:
+            _logger.debug("champion_id not found for champion_name: %s.", champion_name)
+            return None
+        
+        return result[0]
+    
+    
     def get_passive(self, champion_id: int) -> Passive | None:
         """
         Gets a champion's passive from the cache database.
@@ -463,33 +841,20 @@ class Cacher:
         ### Returns:
             `Passive | None` : Returns a `Passive` object if found. Otherwise returns `None`.
         """
-        self.conn = self.connect()
-        self.cursor = self.conn.cursor()
+        cursor = self.connect().cursor()
         
-        self.logger.debug(f"Getting passive for champion_id: {champion_id}...")
+        _logger.debug("Getting passive for champion_id: %s...", champion_id)
         
-        self.cursor.execute(
-            """
-            SELECT *
-            FROM tblPassives
-            WHERE champion_id = ?;
-            """, (champion_id,)
-        )
+        cursor.execute(_SELECT_PASSIVE_SQL, (champion_id,))
         
-        result = self.cursor.fetchone()
-        self.conn.close()
+        result = cursor.fetchone()
         
         if result is None:
-            self.logger.debug(f"Passive not found for champion_id: {champion_id}.")
+            _logger.debug("Passive not found for champion_id: %s.", champion_id)
             return None
         
-        self.logger.debug(f"Passive \"{result[1]}\" found for champion_id: {champion_id}.")
-        return Passive(
-            name=result[1],
-            description=result[2],
-            image_url=result[3],
-            video_url=result[4]
-        )    
+        _logger.debug("Passive \"%s\" found for champion_id: %s.", result[1], champion_id)
+        return self._passive_from_row(result)
          
             
     def get_spells(self, champion_id: int) -> list[Spell] | None:
@@ -503,40 +868,20 @@ class Cacher:
         ### Returns:
             `list[Spell] | None` : Returns a list of `Spell` objects if found. Otherwise returns `None`.
         """
-        self.conn = self.connect()
-        self.cursor = self.conn.cursor()
+        cursor = self.connect().cursor()
         
-        self.logger.debug(f"Getting spells for champion_id: {champion_id}...")
+        _logger.debug("Getting spells for champion_id: %s...", champion_id)
         
-        self.cursor.execute(
-            """
-            SELECT *
-            FROM tblSpells
-            WHERE champion_id = ?;
-            """, (champion_id,)
-        )
+        cursor.execute(_SELECT_CHAMPION_SPELLS_SQL, (champion_id,))
         
-        result = self.cursor.fetchall()
-        self.conn.close()
+        result = cursor.fetchall()
         
         if result is None:
-            self.logger.debug(f"No spells found for champion_id: {champion_id}.")
+            _logger.debug("No spells found for champion_id: %s.", champion_id)
             return None
         
-        self.logger.debug(f"Found spells for champion_id: {champion_id}.")
-        return [Spell(
-            key=spell[1],
-            name=spell[2],
-            description=spell[3],
-            max_rank=spell[4],
-            range_burn=spell[5].split(',') if spell[5] else None,
-            cooldown_burn=spell[6].split(',') if spell[6] else None,
-            cooldown_burn_float=spell[7].split(',') if spell[7] else None,
-            cost_burn=spell[8].split(',') if spell[8] else None,
-            tooltip=spell[9],
-            image_url=spell[10],
-            video_url=spell[11]
-        ) for spell in result]
+        _logger.debug("Found spells for champion_id: %s.", champion_id)
+        return [self._spell_from_row(spell) for spell in result]
     
     
     def get_skins(self, champion_id: int) -> list[Skin] | None:
@@ -550,36 +895,70 @@ class Cacher:
         ### Returns:
             `list[Skin] | None` : Returns a list of `Skin` objects if found. Otherwise returns `None`.
         """
-        self.conn = self.connect()
-        self.cursor = self.conn.cursor()
+        cursor = self.connect().cursor()
         
-        self.logger.debug(f"Getting skins for champion_id: {champion_id}...")
+        _logger.debug("Getting skins for champion_id: %s...", champion_id)
         
-        self.cursor.execute(
-            """
-            SELECT *
-            FROM tblSkins
-            WHERE champion_id = ?;
-            """, (champion_id,)
-        )
+        cursor.execute(_SELECT_CHAMPION_SKINS_SQL, (champion_id,))
         
-        result = self.cursor.fetchall()
-        self.conn.close()
+        result = cursor.fetchall()
         
         if result is None:
-            self.logger.debug(f"No skins found for champion_id: {champion_id}.")
+            _logger.debug("No skins found for champion_id: %s.", champion_id)
             return None
         
-        self.logger.debug(f"Found skins for champion_id: {champion_id}.")
-        return [Skin(
-            champion_id=skin[0],
-            id=skin[1],
-            name=skin[2],
-            centered_image=skin[3],
-            skin_video_url=skin[4],
-            prices=skin[5].split(',') if skin[5] else None,
-            release_date=skin[6]
-        ) for skin in result] 
+        _logger.debug("Found skins for champion_id: %s.", champion_id)
+        return [self._skin_from_row(skin) for skin in result]
+    
+    
+    @staticmethod
+    def _passive_from_row(row: tuple) -> Passive:
+        """
+        Rebuilds a `Passive` object from a `tblPassives` row.
+        """
+        return Passive(
+            name=row[1],
+            description=row[2],
+            image_url=row[3],
+            video_url=row[4]
+        )
+    
+    
+    @staticmethod
+    def _spell_from_row(row: tuple) -> Spell:
+        """
+        Rebuilds a `Spell` object from a `tblSpells` row.
+        """
+        return Spell(
+            key=row[1],
+            name=row[2],
+            description=row[3],
+            max_rank=row[4],
+            range_burn=orjson.loads(row[5]) if row[5] else None,
+            cooldown_burn=orjson.loads(row[6]) if row[6] else None,
+            cooldown_burn_float=orjson.loads(row[7]) if row[7] else None,
+            cost_burn=orjson.loads(row[8]) if row[8] else None,
+            tooltip=row[9],
+            image_url=row[10],
+            video_url=row[11]
+        )
+    
+    
+    @staticmethod
+    def _skin_from_row(row: tuple) -> Skin:
+        """
+        Rebuilds a `Skin` object from a `tblSkins` row.
+        """
+        return Skin(
+            champion_id=row[0],
+            id=row[1],
+            name=row[2],
+            centered_image=row[3],
+            skin_video_url=row[4],
+            prices=[Price(currency, cost) for currency, cost in orjson.loads(row[5])] if row[5] else None,
+            release_date=datetime.fromisoformat(row[7]) if row[7] else None,
+            sales=orjson.loads(row[6]) if row[6] else None
+        )
     
     
     def insert_all_seasons(self, seasons: list[SeasonInfo], return_result: bool = False) -> None | str:
@@ -593,12 +972,9 @@ class Cacher:
         ### Returns:
             `None` | `str, optional` : Returns a string with the amount of rows affected if requested.
         """
-        self.conn = self.connect()
-        self.cursor = self.conn.cursor()
         total_rc = 0
-        return_msg = "You've made changes to the database. Table: {table} | Rows affected: {count}"
         
-        self.logger.debug(f"Attempting to insert {len(seasons)} seasons into cache database...")
+        _logger.debug("Attempting to insert %s seasons into cache database...", len(seasons))
         
         batch_seasons_insert: list[tuple] = []
         
@@ -611,26 +987,14 @@ class Cacher:
                 season_info.is_preseason
             ))
         
-        self.cursor.executemany(
-            """
-            INSERT OR IGNORE INTO tblSeasonInfo (season_id, season_value, season_display_name, season_split, season_is_preseason)
-            VALUES (:1, :2, :3, :4, :5)
-            """,
-            batch_seasons_insert
+        total_rc += self.bulk_upsert(
+            "tblSeasonInfo",
+            ("season_id", "season_value", "season_display_name", "season_split", "season_is_preseason"),
+            batch_seasons_insert,
+            conflict=("season_id",)
         )
         
-        total_rc += self.cursor.rowcount
-        self.logger.debug(return_msg.format(table="tblSeasonInfo", count=self.cursor.rowcount))
-        
-        self.conn.commit()
-        self.conn.close()
-        
-        return_msg = f"You've made several changes to the database. Total rows affected: {total_rc}"
-        
-        if return_result:
-            return return_msg
-        else:
-            self.logger.info(return_msg)
+        return self._report(f"You've made several changes to the database. Total rows affected: {total_rc}", return_result)
         
     
     def get_all_seasons(self) -> list[SeasonInfo] | None:
@@ -640,19 +1004,18 @@ class Cacher:
         ### Returns:
             `list[SeasonInfo]` | `None` : Returns a list of SeasonInfo objects if found. Otherwise returns `None`.
         """
-        self.conn = self.connect()
-        self.cursor = self.conn.cursor()
+        cursor = self.connect().cursor()
         all_seasons = []
         
-        self.logger.info("Getting all seasons from cache database...")
-        self.cursor.execute("SELECT * FROM tblSeasonInfo;")
-        result = self.cursor.fetchall()
+        _logger.info("Getting all seasons from cache database...")
+        cursor.execute(_SELECT_SEASONS_SQL)
+        result = cursor.fetchall()
         
         if result is None:
-            self.logger.info("No seasons found in cache database.")
+            _logger.info("No seasons found in cache database.")
             return None
         else:
-            self.logger.info(f"Found {len(result)} seasons in cache database.")
+            _logger.info("Found %d seasons in cache database.", len(result))
             for i, season in enumerate(result):
                 season_obj = SeasonInfo(
                     id=season[0],
@@ -662,11 +1025,31 @@ class Cacher:
                     is_preseason=season[4] == 1 # boolean values are saved as 0 (false) or 1 (true)
                 )
                 all_seasons.append(season_obj)
-                self.logger.debug(f"Successfully rebuilt the \"{season_obj.display_value}\" season object from cache. ({i+1}/{len(result)})")
+                _logger.debug("Successfully rebuilt the \"%s\" season object from cache. (%s/%s)", season_obj.display_value, i+1, len(result))
                 
             return all_seasons
     
     
+    def _report(self, return_msg: str, return_result: bool) -> None | str:
+        """
+        Hands a write summary back to the caller if requested, otherwise logs it. (Shared by the insert methods)
+        
+        ### Args:
+            return_msg : `str`
+                Summary of the changes made.
+            
+            return_result : `bool`
+                Whether to return the summary instead of logging it.
+        
+        ### Returns:
+            `str, optional` : The summary, if `return_result` is set.
+        """
+        if return_result:
+            return return_msg
+        
+        _logger.info(return_msg)
+    
+    
     def drop_tables(self, tables: list[str]) -> None:
         """
         Drops all specified tables.
@@ -675,22 +1058,116 @@ class Cacher:
             tables : `str`
                 A list of table names to be deleted/dropped
         """
-        self.conn = self.connect()
-        self.cursor = self.conn.cursor()
-        
-        for table in tables:
-            self.logger.debug(f"Dropping table \"{table}\" ...")
-            self.cursor.execute(f"DROP TABLE IF EXISTS {table}")
-        
-        self.conn.commit()
-        self.conn.close()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            for table in tables:
+                _logger.debug("Dropping table \"%s\" ...", table)
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
         
     
+    @property
+    def conn(self) -> sqlite3.Connection | None:
+        """
+        The calling thread's open connection, or `None` if it hasn't connected yet.
+        """
+        return getattr(self._local, "conn", None)
+    
+    
     def connect(self) -> sqlite3.Connection:
         """
-        Connects to local database, if it doesn't exist, one will be created.
+        Connects to local database, if it doesn't exist, one will be created.\n
+        Each thread opens its own connection once and reuses it for every method until `close()` is called, 
+        so threads never share a transaction. (WAL lets their reads run alongside each other and the writer)
         
         ### Returns:
             `sqlite3.Connection` : Returns a connection object.
         """
-        return sqlite3.connect(self.db_path)
+        conn = getattr(self._local, "conn", None)
+        
+        if conn is None:
+            # check_same_thread=False only so close() can release it from whichever thread calls it. The statement cache
+            # has room for every fixed statement above plus the per-size IN (...) lookups of get_summoner_ids
+            conn = self._local.conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level=None, cached_statements=256
+            )
+            self._configure(conn)
+            
+            with self._conns_lock:
+                self._conns.append(conn)
+        
+        return conn
+    
+    
+    @contextmanager
+    def _transaction(self, conn: sqlite3.Connection | None = None) -> Iterator[sqlite3.Connection]:
+        """
+        Runs the enclosed writes as one explicit `BEGIN IMMEDIATE ... COMMIT` transaction, rolled back on error.
+        Nested uses join the outer transaction.
+        
+        Connections are opened in autocommit mode (`isolation_level=None`), so the sqlite3 module never opens
+        implicit transactions of its own, and the write lock is taken up front instead of on the first write.
+        
+        ### Args:
+            conn : `sqlite3.Connection, optional`
+                Connection to use. Defaults to the shared one from `connect()`.
+        """
+        conn = conn or self.connect()
+        
+        # already inside a transaction (nested call), let the outer one commit
+        if conn.in_transaction:
+            yield conn
+            return
+        
+        conn.execute("BEGIN IMMEDIATE;")
+        
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK;")
+            raise
+        
+        conn.execute("COMMIT;")
+    
+    
+    def _configure(self, conn: sqlite3.Connection) -> None:
+        """
+        Applies the journaling and cache PRAGMAs to a freshly opened connection.
+        
+        WAL persists in the database file itself, the rest only last for the life of the connection. 
+        (64 MiB page cache, 256 MiB mmap, WAL file truncated back to 64 MiB after checkpoints)
+        
+        ### Args:
+            conn : `sqlite3.Connection`
+                Connection to configure.
+        """
+        conn.executescript(_PRAGMA_SQL)
+    
+    
+    def close(self) -> None:
+        """
+        Waits for queued writes, stops the background writer, then closes every thread's database connection. 
+        The next call to `connect()` (from any thread) opens a new one. (And the next `queue_summoners()` a new writer)
+        """
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        
+        if writer is not None and writer.is_alive():
+            self._write_queue.put(None)
+            writer.join()
+        
+        with self._conns_lock:
+            for conn in self._conns:
+                conn.close()
+            
+            self._conns.clear()
+            # drops the now closed connection from every thread's local storage at once
+            self._local = threading.local()
+    
+    
+    def __enter__(self):
+        return self
+    
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
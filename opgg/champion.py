@@ -5,6 +5,8 @@
 # License : BSD-3-Clause
 
 
+import orjson
+
 from datetime import datetime
 from opgg.params import By
 
@@ -19,6 +21,8 @@ class Passive:
         `image_url: str` - URL to the passive image\n
         `video_url: str` - URL to the passive video\n
     """
+    __slots__ = ("_name", "_description", "_image_url", "_video_url")
+    
     def __init__(self,
                  name: str,
                  description: str,
@@ -75,6 +79,11 @@ class Spell:
         `image_url: str` - URL to the spell image\n
         `video_url: str` - URL to the spell video\n
     """
+    __slots__ = (
+        "_key", "_name", "_description", "_max_rank", "_range_burn", "_cooldown_burn", "_cooldown_burn_float",
+        "_cost_burn", "_tooltip", "_image_url", "_video_url"
+    )
+    
     def __init__(self,
                  key: str,
                  name: str,
@@ -188,6 +197,8 @@ class Price:
         `currency: str` - Currency of the price\n
         `cost: int` - Cost of the price\n
     """
+    __slots__ = ("_currency", "_cost")
+    
     def __init__(self,
                  currency: str,
                  cost: int) -> None:
@@ -226,6 +237,10 @@ class Skin:
         `sales: list` - List of sales for the skin. Defaults to None.\n
         `release_date: datetime` - Release date of the skin\n
     """
+    __slots__ = (
+        "_id", "_champion_id", "_name", "_centered_image", "_skin_video_url", "_prices", "_sales", "_release_date"
+    )
+    
     def __init__(self,
                  id: int,
                  champion_id: int,
@@ -321,6 +336,8 @@ class Champion:
         `spells: list[Spell]` - List of Spell objects for the champion\n
         `skins: list[Skin]` - List of Skin objects for the champion\n
     """
+    __slots__ = ("_id", "_key", "_name", "_image_url", "_evolve", "_partype", "_passive", "_spells", "_skins")
+    
     def __init__(self,
                  id: int,
                  key: str,
@@ -425,8 +442,148 @@ class Champion:
                         return price.cost
             else:
                 return None
+    
+    
+    @classmethod
+    def from_dict(cls, champion: dict) -> "Champion":
+        """
+        Build a champion (and its passive, spells, skins and prices) from OPGG's champion JSON, or from `to_dict()`.
+        
+        ### Args:
+            champion : `dict`
+                A single champion, as found in the champions api / page props.
+        
+        ### Returns:
+            `Champion` : The rebuilt champion object.
+        """
+        _fromiso = datetime.fromisoformat
+        
+        def _prices(skin: dict) -> list[Price] | None:
+            if not skin["prices"]:
+                return None
+            
+            return [Price("RP" if "RP" in price["currency"] else "BE", price["cost"]) for price in skin["prices"]]
+        
+        return cls(
+            champion["id"],
+            champion["key"],
+            champion["name"],
+            champion["image_url"],
+            champion["evolve"],
+            champion["partype"],
+            Passive(
+                champion["passive"]["name"],
+                champion["passive"]["description"],
+                champion["passive"]["image_url"],
+                champion["passive"]["video_url"]
+            ),
+            [
+                Spell(
+                    spell["key"],
+                    spell["name"],
+                    spell["description"],
+                    spell["max_rank"],
+                    spell["range_burn"],
+                    spell["cooldown_burn"],
+                    spell["cooldown_burn_float"],
+                    spell["cost_burn"],
+                    spell["tooltip"],
+                    spell["image_url"],
+                    spell["video_url"]
+                ) for spell in champion["spells"]
+            ],
+            [
+                Skin(
+                    skin["id"],
+                    skin["champion_id"],
+                    skin["name"],
+                    skin["centered_image"],
+                    skin["skin_video_url"],
+                    _prices(skin),
+                    _fromiso(skin["release_date"]) if skin["release_date"] else None,
+                    skin["sales"]
+                ) for skin in champion["skins"]
+            ]
+        )
+    
+    
+    def to_dict(self) -> dict:
+        """
+        Serialize the champion back into OPGG's champion JSON shape. (Round trips through `from_dict()`)
         
+        Skin release dates are left as `datetime`, orjson encodes them natively. (See `to_json()`)
         
+        ### Returns:
+            `dict` : The champion, with its passive, spells and skins nested.
+        """
+        return {
+            "id": self._id,
+            "key": self._key,
+            "name": self._name,
+            "image_url": self._image_url,
+            "evolve": self._evolve,
+            "partype": self._partype,
+            "passive": {
+                "name": self._passive._name,
+                "description": self._passive._description,
+                "image_url": self._passive._image_url,
+                "video_url": self._passive._video_url
+            },
+            "spells": [
+                {
+                    "key": spell._key,
+                    "name": spell._name,
+                    "description": spell._description,
+                    "max_rank": spell._max_rank,
+                    "range_burn": spell._range_burn,
+                    "cooldown_burn": spell._cooldown_burn,
+                    "cooldown_burn_float": spell._cooldown_burn_float,
+                    "cost_burn": spell._cost_burn,
+                    "tooltip": spell._tooltip,
+                    "image_url": spell._image_url,
+                    "video_url": spell._video_url
+                } for spell in self._spells
+            ],
+            "skins": [
+                {
+                    "id": skin._id,
+                    "champion_id": skin._champion_id,
+                    "name": skin._name,
+                    "centered_image": skin._centered_image,
+                    "skin_video_url": skin._skin_video_url,
+                    "prices": [{"currency": price._currency, "cost": price._cost} for price in skin._prices] if skin._prices else None,
+                    "release_date": skin._release_date,
+                    "sales": skin._sales
+                } for skin in self._skins
+            ]
+        }
+    
+    
+    def to_json(self) -> bytes:
+        """
+        Serialize the champion straight to JSON bytes with orjson.
+        
+        ### Returns:
+            `bytes` : The encoded champion. (See `to_dict()`)
+        """
+        return orjson.dumps(self.to_dict())
+    
+    
+    @classmethod
+    def from_json(cls, data: bytes | str) -> "Champion":
+        """
+        Rebuild a champion from JSON produced by `to_json()` (or OPGG's own champion JSON).
+        
+        ### Args:
+            data : `bytes | str`
+                The encoded champion.
+        
+        ### Returns:
+            `Champion` : The rebuilt champion object.
+        """
+        return cls.from_dict(orjson.loads(data))
+    
+    
     def __repr__(self) -> str:
         return f"Champion(name={self.name})"
 
@@ -483,6 +640,19 @@ class ChampionStats:
         `snowball_throws: int` - Number of snowball throws\n
         `snowball_hits: int` - Number of snowball hits\n
     """
+    __slots__ = (
+        "_champion", "_id", "_play", "_win", "_lose", "_kill", "_death", "_assist", "_gold_earned", "_minion_kill",
+        "_turret_kill", "_neutral_minion_kill", "_damage_dealt", "_damage_taken", "_physical_damage_dealt",
+        "_magic_damage_dealt", "_most_kill", "_max_kill", "_max_death", "_double_kill", "_triple_kill",
+        "_quadra_kill", "_penta_kill", "_game_length_second", "_inhibitor_kills", "_sight_wards_bought_in_game",
+        "_vision_wards_bought_in_game", "_vision_score", "_wards_placed", "_wards_killed", "_heal",
+        "_time_ccing_others", "_op_score", "_is_max_in_team_op_score", "_physical_damage_taken",
+        "_damage_dealt_to_champions", "_physical_damage_dealt_to_champions", "_magic_damage_dealt_to_champions",
+        "_damage_dealt_to_objectives", "_damage_dealt_to_turrets", "_damage_self_mitigated",
+        "_max_largest_multi_kill", "_max_largest_critical_strike", "_max_largest_killing_spree", "_snowball_throws",
+        "_snowball_hits", "_kda", "_win_rate"
+    )
+    
     def __init__(self,
                  champion: Champion,
                  id: int,
@@ -578,6 +748,10 @@ class ChampionStats:
         self._snowball_throws = snowball_throws
         self._snowball_hits = snowball_hits        
         
+        # derived from the read-only stats above, computed on first access (see kda / win_rate)
+        self._kda: float | None = None
+        self._win_rate: float | None = None
+        
     @property
     def champion(self) -> Champion:
         """
@@ -751,14 +925,20 @@ class ChampionStats:
         """
         A `float` representing the KDA of the champion.
         """
-        return (self._kill + self._assist) / self._death if self._death != 0 else 0
+        if self._kda is None:
+            self._kda = (self._kill + self._assist) / self._death if self._death != 0 else 0
+        
+        return self._kda
 
     @property
     def win_rate(self) -> float:
         """
         A `float` representing the win rate of the champion.
         """
-        return round(float((self._win / self._play) * 100), 2) if self._play != 0 else 0
+        if self._win_rate is None:
+            self._win_rate = round(float((self._win / self._play) * 100), 2) if self._play != 0 else 0
+        
+        return self._win_rate
 
     @property
     def inhibitor_kills(self) -> int:
@@ -4,6 +4,22 @@
 # Date    : 2023-07-05
 # License : BSD-3-Clause
 
+from array import array
+
+from opgg.params import Position, TeamKey
+
+
+# GameStats bit flags, every boolean of a team's game stats is packed into a single int
+_IS_WIN = 1 << 0
+_CHAMPION_FIRST = 1 << 1
+_INHIBITOR_FIRST = 1 << 2
+_RIFT_HERALD_FIRST = 1 << 3
+_DRAGON_FIRST = 1 << 4
+_BARON_FIRST = 1 << 5
+_TOWER_FIRST = 1 << 6
+_HORDE_FIRST = 1 << 7
+_IS_REMAKE = 1 << 8
+
 
 class Stats:
     """
@@ -48,6 +64,18 @@ class Stats:
         `op_score_timeline: list[dict]` - Timeline of op scores\n
         `op_score_timeline_analysis: dict` - Analysis of op score timeline\n
     """
+    __slots__ = (
+        "_champion_level", "_damage_self_mitigated", "_damage_dealt_to_objectives", "_damage_dealt_to_turrets",
+        "_magic_damage_dealt_player", "_physical_damage_taken", "_physical_damage_dealt_to_champions",
+        "_total_damage_taken", "_total_damage_dealt", "_total_damage_dealt_to_champions",
+        "_largest_critical_strike", "_time_ccing_others", "_vision_score", "_vision_wards_bought_in_game",
+        "_sight_wards_bought_in_game", "_ward_kill", "_ward_place", "_turret_kill", "_barrack_kill", "_kill",
+        "_death", "_assist", "_largest_multi_kill", "_largest_killing_spree", "_minion_kill",
+        "_neutral_minion_kill_team_jungle", "_neutral_minion_kill_enemy_jungle", "_neutral_minion_kill",
+        "_gold_earned", "_total_heal", "_result", "_op_score", "_op_score_rank", "_is_opscore_max_in_team",
+        "_lane_score", "_op_score_timeline", "_op_score_timeline_analysis"
+    )
+    
     def __init__(self,
                  champion_level: int,
                  damage_self_mitigated: int,
@@ -557,7 +585,13 @@ class GameStats:
         `assist: int` - Number of assists\n
         `gold_earned: int` - Total gold earned\n
         `kill: int` - Number of kills\n
+        `flags: int` - Bitmask of all the boolean stats above\n
     """
+    __slots__ = (
+        "_flags", "_champion_kill", "_inhibitor_kill", "_rift_herald_kill", "_dragon_kill", "_baron_kill", "_tower_kill",
+        "_horde_kill", "_death", "_assist", "_gold_earned", "_kill"
+    )
+    
     def __init__(self,
                  is_win: bool,
                  champion_kill: int,
@@ -579,37 +613,46 @@ class GameStats:
                  assist: int,
                  gold_earned: int,
                  kill: int) -> None:
-        self._is_win = is_win
+        self._flags = (
+            (_IS_WIN if is_win else 0) |
+            (_CHAMPION_FIRST if champion_first else 0) |
+            (_INHIBITOR_FIRST if inhibitor_first else 0) |
+            (_RIFT_HERALD_FIRST if rift_herald_first else 0) |
+            (_DRAGON_FIRST if dragon_first else 0) |
+            (_BARON_FIRST if baron_first else 0) |
+            (_TOWER_FIRST if tower_first else 0) |
+            (_HORDE_FIRST if horde_first else 0) |
+            (_IS_REMAKE if is_remake else 0)
+        )
         self._champion_kill = champion_kill
-        self._champion_first = champion_first
         self._inhibitor_kill = inhibitor_kill
-        self._inhibitor_first = inhibitor_first
         self._rift_herald_kill = rift_herald_kill
-        self._rift_herald_first = rift_herald_first
         self._dragon_kill = dragon_kill
-        self._dragon_first = dragon_first
         self._baron_kill = baron_kill
-        self._baron_first = baron_first
         self._tower_kill = tower_kill
-        self._tower_first = tower_first
         self._horde_kill = horde_kill
-        self._horde_first = horde_first
-        self._is_remake = is_remake
         self._death = death
         self._assist = assist
         self._gold_earned = gold_earned
         self._kill = kill
 
+    @property
+    def flags(self) -> int:
+        """
+        An `int` bitmask of every boolean stat (`is_win`, the `*_first` flags and `is_remake`)
+        """
+        return self._flags
+    
     @property
     def is_win(self) -> bool:
         """
         A `bool` representing the game result
         """
-        return self._is_win
+        return bool(self._flags & _IS_WIN)
     
     @is_win.setter
     def is_win(self, value: bool) -> None:
-        self._is_win = value
+        self._flags = self._flags | _IS_WIN if value else self._flags & ~_IS_WIN
 
     @property
     def champion_kill(self) -> int:
@@ -627,11 +670,11 @@ class GameStats:
         """
         A `bool` representing if team got first champion kill
         """
-        return self._champion_first
+        return bool(self._flags & _CHAMPION_FIRST)
     
     @champion_first.setter
     def champion_first(self, value: bool) -> None:
-        self._champion_first = value
+        self._flags = self._flags | _CHAMPION_FIRST if value else self._flags & ~_CHAMPION_FIRST
     
     @property
     def inhibitor_kill(self) -> int:
@@ -649,11 +692,11 @@ class GameStats:
         """
         A `bool` representing if team got first inhibitor kill
         """
-        return self._inhibitor_first
+        return bool(self._flags & _INHIBITOR_FIRST)
     
     @inhibitor_first.setter
     def inhibitor_first(self, value: bool) -> None:
-        self._inhibitor_first = value
+        self._flags = self._flags | _INHIBITOR_FIRST if value else self._flags & ~_INHIBITOR_FIRST
     
     @property
     def rift_herald_kill(self) -> int:
@@ -671,11 +714,11 @@ class GameStats:
         """
         A `bool` representing if team got first rift herald kill
         """
-        return self._rift_herald_first
+        return bool(self._flags & _RIFT_HERALD_FIRST)
     
     @rift_herald_first.setter
     def rift_herald_first(self, value: bool) -> None:
-        self._rift_herald_first = value
+        self._flags = self._flags | _RIFT_HERALD_FIRST if value else self._flags & ~_RIFT_HERALD_FIRST
     
     @property
     def dragon_kill(self) -> int:
@@ -693,11 +736,11 @@ class GameStats:
         """
         A `bool` representing if team got first dragon
         """
-        return self._dragon_first
+        return bool(self._flags & _DRAGON_FIRST)
     
     @dragon_first.setter
     def dragon_first(self, value: bool) -> None:
-        self._dragon_first = value
+        self._flags = self._flags | _DRAGON_FIRST if value else self._flags & ~_DRAGON_FIRST
         
     @property
     def baron_kill(self) -> int:
@@ -715,11 +758,11 @@ class GameStats:
         """
         A `bool` representing if team got first baron kill
         """
-        return self._baron_first
+        return bool(self._flags & _BARON_FIRST)
     
     @baron_first.setter
     def baron_first(self, value: bool) -> None:
-        self._baron_first = value
+        self._flags = self._flags | _BARON_FIRST if value else self._flags & ~_BARON_FIRST
         
     @property
     def tower_kill(self) -> int:
@@ -737,11 +780,11 @@ class GameStats:
         """
         A `bool` representing if team got first tower kill
         """
-        return self._tower_first
+        return bool(self._flags & _TOWER_FIRST)
     
     @tower_first.setter
     def tower_first(self, value: bool) -> None:
-        self._tower_first = value
+        self._flags = self._flags | _TOWER_FIRST if value else self._flags & ~_TOWER_FIRST
         
     @property
     def horde_kill(self) -> int:
@@ -759,22 +802,22 @@ class GameStats:
         """
         A `bool` representing if team got first void grub kill
         """
-        return self._horde_first
+        return bool(self._flags & _HORDE_FIRST)
     
     @horde_first.setter
     def horde_first(self, value: bool) -> None:
-        self._horde_first = value
+        self._flags = self._flags | _HORDE_FIRST if value else self._flags & ~_HORDE_FIRST
         
     @property
     def is_remake(self) -> bool:
         """
         A `bool` representing if game was a remake
         """
-        return self._is_remake
+        return bool(self._flags & _IS_REMAKE)
     
     @is_remake.setter
     def is_remake(self, value: bool) -> None:
-        self._is_remake = value
+        self._flags = self._flags | _IS_REMAKE if value else self._flags & ~_IS_REMAKE
         
     @property
     def death(self) -> int:
@@ -828,12 +871,14 @@ class Team:
     ### Properties:
         `key: str` - Unique identifier for the game\n
         `game_stat: GameStats` - Detailed statistics of the game\n
-        `banned_champions: list` - List of banned champions in the game\n
+        `banned_champions: tuple[int, ...]` - Banned champions in the game\n
     """
+    __slots__ = ("_key", "_game_stat", "_banned_champions")
+    
     def __init__(self,
                  key: str,
                  game_stat: GameStats,
-                 banned_champions: list) -> None:
+                 banned_champions: tuple[int, ...]) -> None:
         self._key = key
         self._game_stat = game_stat
         self._banned_champions = banned_champions
@@ -861,12 +906,146 @@ class Team:
         self._game_stat = value
     
     @property
-    def banned_champions(self) -> list:
+    def banned_champions(self) -> tuple[int, ...]:
         """
-        A `list` of champion ids that were banned
+        A `tuple` of champion ids that were banned
         """
         return self._banned_champions
     
     @banned_champions.setter
-    def banned_champions(self, value: list) -> None:
+    def banned_champions(self, value: tuple[int, ...]) -> None:
         self._banned_champions = value
+
+
+class GameBatch:
+    """
+    Column (struct-of-arrays) view over the participants of many games, meant for aggregate stats.\n
+    Every participant of every game is one row, each property below is one typed `array` column of equal length.
+    
+    ### Properties:
+        `game_index: array[int]` - Index of the game (in the source list) the row belongs to\n
+        `participant_id: array[int]` - Participant id within its game\n
+        `champion_id: array[int]` - Champion played\n
+        `team: array[int]` - `TeamKey` code of the participant's team\n
+        `position: array[int]` - `Position` code of the participant\n
+        `kill: array[int]` - Number of kills\n
+        `death: array[int]` - Number of deaths\n
+        `assist: array[int]` - Number of assists\n
+        `win: array[int]` - 1 if the participant won the game, 0 otherwise\n
+    """
+    __slots__ = ("game_index", "participant_id", "champion_id", "team", "position", "kill", "death", "assist", "win")
+    
+    # payload string -> enum code lookups, anything unmapped becomes UNKNOWN
+    _TEAMS = {team.name: team for team in TeamKey if team is not TeamKey.UNKNOWN}
+    _POSITIONS = {position.name: position for position in Position if position is not Position.UNKNOWN}
+    
+    def __init__(self) -> None:
+        self.game_index = array("i")
+        self.participant_id = array("i")
+        self.champion_id = array("i")
+        self.team = array("b")
+        self.position = array("b")
+        self.kill = array("i")
+        self.death = array("i")
+        self.assist = array("i")
+        self.win = array("b")
+    
+    @classmethod
+    def from_games(cls, game_data: list[dict]) -> 'GameBatch':
+        """
+        Build a batch straight from the raw games endpoint payload, without creating any `Game`/`Participant` objects.
+        
+        ### Args:
+            game_data : `list[dict]`
+                The "data" list of the games endpoint. (`OPGG.get_recent_games(return_content_only=True)`)
+        
+        ### Returns:
+            `GameBatch` : A GameBatch with one row per participant.
+        """
+        batch = cls()
+        
+        # bind the appends once, they're called for every participant of every game
+        game_index = batch.game_index.append
+        participant_id = batch.participant_id.append
+        champion_id = batch.champion_id.append
+        team = batch.team.append
+        position = batch.position.append
+        kill = batch.kill.append
+        death = batch.death.append
+        assist = batch.assist.append
+        win = batch.win.append
+        teams, positions = cls._TEAMS, cls._POSITIONS
+        
+        for i, game in enumerate(game_data):
+            for participant in game["participants"]:
+                stats = participant["stats"]
+                game_index(i)
+                participant_id(participant["participant_id"])
+                champion_id(participant["champion_id"])
+                team(teams.get(participant["team_key"], TeamKey.UNKNOWN))
+                position(positions.get(participant["position"], Position.UNKNOWN))
+                kill(stats["kill"])
+                death(stats["death"])
+                assist(stats["assist"])
+                win(stats["result"] == "WIN")
+        
+        return batch
+    
+    def __len__(self) -> int:
+        return len(self.game_index)
+    
+    def win_rate_by_champ(self) -> dict[int, float]:
+        """
+        Win rate (0-100) per champion id over every row of the batch.
+        """
+        played: dict[int, int] = {}
+        won: dict[int, int] = {}
+        
+        for champion_id, win in zip(self.champion_id, self.win):
+            played[champion_id] = played.get(champion_id, 0) + 1
+            won[champion_id] = won.get(champion_id, 0) + win
+        
+        return {champion_id: round(won[champion_id] / count * 100, 2) for champion_id, count in played.items()}
+    
+    def win_rate(self, champion_id: int | None = None) -> float:
+        """
+        Win rate (0-100) over every row of the batch, or only the rows of a given champion.
+        
+        ### Args:
+            champion_id : `int, optional`
+                Only count rows where this champion was played. Defaults to None (all rows).
+        """
+        if champion_id is None:
+            played, won = len(self.win), sum(self.win)
+        else:
+            played = won = 0
+            for _champion_id, win in zip(self.champion_id, self.win):
+                if _champion_id == champion_id:
+                    played += 1
+                    won += win
+        
+        return round(won / played * 100, 2) if played != 0 else 0
+    
+    def kda_by_champ(self) -> dict[int, float]:
+        """
+        KDA ((kills + assists) / deaths) per champion id, accumulated in a single pass over the columns.\n
+        Note: Same as `ChampionStats.kda`, a champion with no deaths reports 0.
+        """
+        totals: dict[int, list[int]] = {}
+        
+        for champion_id, kill, death, assist in zip(self.champion_id, self.kill, self.death, self.assist):
+            total = totals.get(champion_id)
+            if total is None:
+                totals[champion_id] = [kill, death, assist]
+            else:
+                total[0] += kill
+                total[1] += death
+                total[2] += assist
+        
+        return {
+            champion_id: (kill + assist) / death if death != 0 else 0 
+            for champion_id, (kill, death, assist) in totals.items()
+        }
+    
+    def __repr__(self) -> str:
+        return f"GameBatch(rows={len(self)}, games={len(set(self.game_index))})"
@@ -19,6 +19,8 @@ class Tier:
         `tier_image_url: str` - URL to the tier image. Defaults to None\n
         `border_image_url: str` - URL to the border image. Defaults to None\n
     """
+    __slots__ = ("_tier", "_division", "_lp", "_level", "_tier_image_url", "_border_image_url")
+    
     def __init__(self,
                  tier: str,
                  division: int,
@@ -112,6 +114,8 @@ class QueueInfo:
         `queue_translate: str` - Game type in KOREAN\n
         `game_type: str` - Queue/Game type\n
     """
+    __slots__ = ("_id", "_queue_translate", "_game_type")
+    
     def __init__(self,
                  id: int,
                  queue_translate: str,
@@ -173,6 +177,11 @@ class LeagueStats:
         `series: bool` - Series object\n
         `updated_at: datetime` - Datetime object representing the last time the stats were updated\n
     """
+    __slots__ = (
+        "_queue_info", "_tier_info", "_win", "_lose", "_is_hot_streak", "_is_fresh_blood", "_is_veteran",
+        "_is_inactive", "_series", "_updated_at"
+    )
+    
     def __init__(self,
                  queue_info: QueueInfo,
                  tier_info: Tier,
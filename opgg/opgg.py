@@ -5,24 +5,225 @@
 # License : BSD-3-Clause
 
 import os
-import json
+import sys
 import logging
+import threading
+import orjson
+import random
 import requests
-import traceback
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from operator import itemgetter
 from typing import Literal
-from fake_useragent import UserAgent
 
 # from opgg.summoner import 
-from opgg.game import GameStats, Stats, Team
+from opgg.game import GameBatch, GameStats, Stats, Team
 from opgg.season import RankEntry, Season, SeasonInfo
 from opgg.champion import ChampionStats, Champion
 from opgg.league_stats import LeagueStats, Tier, QueueInfo
-from opgg.summoner import Game, Participant, Summoner
+from opgg.summoner import Game, Participant, Summoner, _TIER_FIELDS, _summoner_getter, _tier_getter, _dedup, _intern
 from opgg.params import Region
 from opgg.cacher import Cacher
-from opgg.utils import Utils
+from opgg.utils import Utils, _UA_POOL
+
+
+_logger = logging.getLogger("OPGG.py")
+
+# bound once, called positionally as _build_summary_url(region, summoner_id) / _build_games_url(region, summoner_id)
+_build_summary_url = f"{Utils._base_api_url}/summoners/{{}}/{{}}/summary".format
+_build_games_url = f"{Utils._base_api_url}/games/{{}}/summoners/{{}}".format
+
+# Field names in the positional order of their model's __init__. The getters are built once at import so each
+# object is filled from its payload dict with a single C level call instead of one subscript per field.
+# (Summoner/Stats/Tier live next to the participant builder in summoner.py)
+_GAME_STATS_FIELDS = (
+    "is_win", "champion_kill", "champion_first", "inhibitor_kill", "inhibitor_first", "rift_herald_kill", 
+    "rift_herald_first", "dragon_kill", "dragon_first", "baron_kill", "baron_first", "tower_kill", "tower_first", 
+    "horde_kill", "horde_first", "is_remake", "death", "assist", "gold_earned", "kill"
+)
+_QUEUE_INFO_FIELDS = ("id", "queue_translate", "game_type")
+# LeagueStats / ChampionStats minus their leading nested objects (queue_info & tier_info / champion)
+_LEAGUE_STATS_FIELDS = (
+    "win", "lose", "is_hot_streak", "is_fresh_blood", "is_veteran", "is_inactive", "series", "updated_at"
+)
+_CHAMPION_STATS_FIELDS = (
+    "id", "play", "win", "lose", "kill", "death", "assist", "gold_earned", "minion_kill", "turret_kill", 
+    "neutral_minion_kill", "damage_dealt", "damage_taken", "physical_damage_dealt", "magic_damage_dealt", 
+    "most_kill", "max_kill", "max_death", "double_kill", "triple_kill", "quadra_kill", "penta_kill", 
+    "game_length_second", "inhibitor_kills", "sight_wards_bought_in_game", "vision_wards_bought_in_game", 
+    "vision_score", "wards_placed", "wards_killed", "heal", "time_ccing_others", "op_score", 
+    "is_max_in_team_op_score", "physical_damage_taken", "damage_dealt_to_champions", 
+    "physical_damage_dealt_to_champions", "magic_damage_dealt_to_champions", "damage_dealt_to_objectives", 
+    "damage_dealt_to_turrets", "damage_self_mitigated", "max_largest_multi_kill", "max_largest_critical_strike", 
+    "max_largest_killing_spree", "snowball_throws", "snowball_hits"
+)
+
+_game_stats_getter = itemgetter(*_GAME_STATS_FIELDS)
+# the game's average tier only carries the tier, division and image urls
+_average_tier_getter = itemgetter(*_TIER_FIELDS[:4])
+# previous season tiers come without a level
+_season_tier_getter = itemgetter(*_TIER_FIELDS[:5])
+_queue_info_getter = itemgetter(*_QUEUE_INFO_FIELDS)
+_league_stats_getter = itemgetter(*_LEAGUE_STATS_FIELDS)
+_champion_stats_getter = itemgetter(*_CHAMPION_STATS_FIELDS)
+
+
+_logging_ready = False
+_logging_lock = threading.Lock()
+
+
+def _remove_empty_logs(keep: str) -> None:
+    """
+    Deletes the empty log files left behind by previous runs, except for `keep`. (Today's log file)
+    
+    Runs on a background thread (see `_setup_logging`), so OPGG construction never waits on the directory scan.
+    """
+    for file in os.listdir('./logs'):
+        if file == keep:
+            continue
+        
+        try:
+            if os.stat(f"./logs/{file}").st_size == 0:
+                _logger.info("Removing empty log file: %s", file)
+                os.remove(f"./logs/{file}")
+        except OSError:
+            # removed (or locked) by another process in the meantime
+            continue
+
+
+def _setup_logging() -> None:
+    """
+    Creates the logs directory and configures the log file the first time an `OPGG` object is made in this process.
+    Later calls return immediately.
+    """
+    global _logging_ready
+    
+    with _logging_lock:
+        if _logging_ready:
+            return
+        
+        _logging_ready = True
+        log_file = f'opgg_{datetime.now().strftime("%Y-%m-%d")}.log'
+        
+        # ===== SETUP START =====
+        logging.root.name = 'OPGG.py'
+        
+        if not os.path.exists('./logs'):
+            logging.info("Creating logs directory...")
+            os.mkdir('./logs')
+        else:
+            threading.Thread(target=_remove_empty_logs, args=(log_file,), name="OPGG.py-logs", daemon=True).start()
+        
+        logging.basicConfig(
+            filename=f'./logs/{log_file}',
+            filemode='a+', 
+            format='[%(asctime)s][%(name)s->%(module)s:%(lineno)-10d][%(levelname)-7s] : %(message)s', 
+            datefmt='%d-%b-%y %H:%M:%S',
+            level=logging.INFO
+        )
+        # ===== SETUP END =====
+
+
+# The builders bind the model classes and getters they use as keyword-only defaults (same idiom as functools._make_key),
+# turning every global lookup in these per-game hot paths into a LOAD_FAST.
+def _build_game(game: dict, cache: dict | None = None, *, 
+                Game=Game, Team=Team, GameStats=GameStats, QueueInfo=QueueInfo, Tier=Tier, _dedup=_dedup, _intern=_intern,
+                _game_stats_getter=_game_stats_getter, 
+                _average_tier_getter=_average_tier_getter, _queue_info_getter=_queue_info_getter) -> Game:
+    """
+    Build a `Game` object from a raw game dict of the games endpoint.\n
+    Fields opgg always sends are subscripted directly, only the optional ones (`is_recorded`, `record_info`, `memo`) use `.get()`.
+    
+    Kept at module level (no reference to an OPGG instance) so games can be built independently of each other.
+    
+    ### Args:
+        game : `dict`
+            A single entry of the games endpoint "data" list.
+        
+        cache : `dict, optional`
+            Per-batch dedup cache, see `_build_participant`.
+    
+    ### Returns:
+        `Game` : A Game object representing the game.
+    """
+    teams = []
+    for team in game["teams"]:
+        teams.append(Team(
+            key=_intern(team["key"]),
+            game_stat=GameStats(*_game_stats_getter(team["game_stat"])),
+            banned_champions=tuple(team["banned_champions"])
+        ))
+    
+    return Game(
+        id = game["id"],
+        created_at=game["created_at"],
+        game_map=_intern(game["game_map"]),
+        queue_info=QueueInfo(*_queue_info_getter(game["queue_info"])),
+        version=game["version"],
+        game_length_second=game["game_length_second"],
+        is_remake=game["is_remake"],
+        is_opscore_active=game["is_opscore_active"],
+        # opgg sends null (or nothing) for unrecorded games, normalized here once instead of on every read
+        is_recorded=game.get("is_recorded") or False,
+        record_info=game.get("record_info"),
+        average_tier_info=_dedup(cache, Tier, _average_tier_getter(game["average_tier_info"])),
+        participants=None,
+        teams=teams,
+        memo=game.get("memo"),
+        myData=None,
+        # participants/myData are the bulk of a game (11 Summoner/Stats/Tier triples), only build them when accessed
+        raw_participants=game["participants"],
+        raw_my_data=game["myData"],
+        cache=cache
+    )
+
+
+def _try_build_game(game: dict, cache: dict | None = None) -> Game | None:
+    """
+    Wrapper around `_build_game` that logs and returns None for malformed games instead of raising.
+    """
+    try:
+        return _build_game(game, cache)
+    except KeyError as e:
+        # schema drift on opgg's side, degrade to skipping the game
+        _logger.warning("Missing field %s in game %s, skipping...", e, game.get("id"))
+        return None
+    except (TypeError, AttributeError) as e:
+        # only pay for the formatted traceback when someone is actually debugging
+        _logger.error(
+            "Unable to create game object, skipping game %s: %r", 
+            game.get("id") if isinstance(game, dict) else None, e,
+            exc_info=_logger.isEnabledFor(logging.DEBUG)
+        )
+        return None
+
+
+def _build_games(games: list[dict]) -> list[Game]:
+    """
+    Build every game of a games endpoint response in one call, dropping the malformed ones.
+    
+    ### Args:
+        games : `list[dict]`
+            The games endpoint "data" list.
+    
+    ### Returns:
+        `list[Game]` : A list of Game objects, in the order they were given.
+    """
+    # Building a game is pure python object construction, so threads only help when the GIL is disabled
+    # (free-threaded 3.13+ builds). A process pool would spend more time pickling the Game objects back
+    # than it saves, so on regular builds the games are simply built in order.
+    # the same summoner (myData) and a handful of tiers repeat across every game of the batch. The cache only
+    # lives for this call, objects are mutable so they are never shared between separate requests.
+    cache = {}
+    if len(games) >= 4 and not getattr(sys, "_is_gil_enabled", lambda: True)():
+        with ThreadPoolExecutor(max_workers=min(4, len(games))) as executor:
+            recent_games = list(executor.map(partial(_try_build_game, cache=cache), games))
+    else:
+        recent_games = [_try_build_game(game, cache) for game in games]
+    
+    return [game for game in recent_games if game is not None]
 
 
 class OPGG:
@@ -53,55 +254,36 @@ class OPGG:
         self._summoner_id = summoner_id
         self._region = region
         
-        self._base_api_url = "https://lol-web-api.op.gg/api/v1.0/internal/bypass"
-        self._api_url = f"{self._base_api_url}/summoners/{self.region}/{self.summoner_id}/summary"
-        self._games_api_url = f"{self._base_api_url}/games/{self.region}/summoners/{self.summoner_id}"
+        self._base_api_url = Utils._base_api_url
+        self._api_url = _build_summary_url(self.region, self.summoner_id)
+        self._games_api_url = _build_games_url(self.region, self.summoner_id)
         
-        self._ua = UserAgent()
+        # a static pool instead of fake_useragent, which parsed its whole bundled UA database per instance
         self._headers = { 
-            "User-Agent": self._ua.random
+            "User-Agent": random.choice(_UA_POOL)
         }
         
         self._all_champions = None
         self._all_seasons = None
         
 
-        # ===== SETUP START =====
-        logging.root.name = 'OPGG.py'
-
-        if not os.path.exists('./logs'):
-            logging.info("Creating logs directory...")
-            os.mkdir('./logs')
-        else:
-            # remove empty log files
-            for file in os.listdir('./logs'):
-                if os.stat(f"./logs/{file}").st_size == 0 and file != f'opgg_{datetime.now().strftime("%Y-%m-%d")}.log':
-                    logging.info(f"Removing empty log file: {file}")
-                    os.remove(f"./logs/{file}")
-                    
-        logging.basicConfig(
-            filename=f'./logs/opgg_{datetime.now().strftime("%Y-%m-%d")}.log',
-            filemode='a+', 
-            format='[%(asctime)s][%(name)s->%(module)s:%(lineno)-10d][%(levelname)-7s] : %(message)s', 
-            datefmt='%d-%b-%y %H:%M:%S',
-            level=logging.INFO
-        )
-        # ===== SETUP END =====
+        # logging is configured (and old logs cleaned up) once per process, not per instance
+        _setup_logging()
         
         # allow the user to interact with the logger
         self._logger = logging.getLogger("OPGG.py")
         
-        # at object creation, setup and query the cache
-        self._cacher = Cacher()
-        self._cacher.setup()
+        # the cache is set up once per process (per day), every OPGG object shares it
+        self._cacher = Cacher.shared()
         
         self.logger.info(
-            f"OPGG.__init__(summoner_id={self.summoner_id}, " \
-            f"region={self.region}, " \
-            f"api_url={self.api_url}, " \
-            f"headers={self.headers}, " \
-            f"all_champions={self.all_champions}, " \
-            f"all_seasons={self.all_seasons})"
+            "OPGG.__init__(summoner_id=%s, region=%s, api_url=%s, headers=%s, all_champions=%s, all_seasons=%s)",
+            self.summoner_id,
+            self.region,
+            self.api_url,
+            self.headers,
+            self.all_champions,
+            self.all_seasons
         )
         
     
@@ -193,15 +375,15 @@ class OPGG:
         """
         A method to refresh the api url with the current summoner id and region.
         """
-        self.api_url = f"{self._base_api_url}/summoners/{self.region}/{self.summoner_id}/summary"
-        self._games_api_url = f"{self._base_api_url}/games/{self.region}/summoners/{self.summoner_id}"
+        self.api_url = _build_summary_url(self.region, self.summoner_id)
+        self._games_api_url = _build_games_url(self.region, self.summoner_id)
         
-        self.logger.debug(f"self.refresh_api_url() called... See URLs:")
-        self.logger.debug(f"self.api_url = {self.api_url}")
-        self.logger.debug(f"self._games_api_url = {self._games_api_url}")
+        self.logger.debug("self.refresh_api_url() called... See URLs:")
+        self.logger.debug("self.api_url = %s", self.api_url)
+        self.logger.debug("self._games_api_url = %s", self._games_api_url)
     
     
-    def get_summoner(self, return_content_only = False) -> Summoner | dict:
+    def get_summoner(self, return_content_only = False, summoner_id: str | None = None) -> Summoner | dict:
         """
         A method to get data from the OPGG API and form a Summoner object.
         
@@ -209,22 +391,27 @@ class OPGG:
             -> Send request to OPGG API\n
             -> Parse data from request (jsonify)\n
             -> Loop through data and form the summoner object.
+        
+        ### Args:
+            summoner_id : `str, optional`
+                Fetch this summoner id instead of the instance's `summoner_id`.\n
+                Note: Does not touch the instance state, which is what lets `search()` fetch summoners concurrently.
             
         ### Returns:
-            `Summoner`: A Summoner object representing the summoner.
-        """        
-        self.logger.info(f"Sending request to OPGG API... (API_URL = {self.api_url}, HEADERS = {self.headers})")
-        res = requests.get(self.api_url, headers=self.headers)
+            `Summoner`: A Summoner object representing the summoner.\n
+            Note: If the recent games can't be fetched or parsed, the error is logged and `recent_game_stats` is an empty list.
+        """
+        api_url = self.api_url if summoner_id is None else _build_summary_url(self.region, summoner_id)
         
-        previous_seasons: list[Season]      = []
-        league_stats: list[LeagueStats]     = []
-        most_champions: list[ChampionStats] = []
-        recent_game_stats: list[Game]       = []
+        self.logger.info("Sending request to OPGG API... (API_URL = %s, HEADERS = %s)", api_url, self.headers)
+        res = Utils.request("GET", api_url, headers=self.headers)
         
         if res.status_code == 200:
-            self.logger.info(f"Request to OPGG API was successful, parsing data (Content Length: {len(res.text)})...")
-            self.logger.debug(f"SUMMONER DATA AT /SUMMARY ENDPOINT:\n{res.text}\n")
-            content = json.loads(res.text)["data"]
+            self.logger.info("Request to OPGG API was successful, parsing data (Content Length: %d)...", len(res.content))
+            # dumping the whole payload means decoding the body to text, only pay for that when debugging
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("SUMMONER DATA AT /SUMMARY ENDPOINT:\n%s\n", res.text)
+            content = orjson.loads(res.content)["data"]
         else:
             res.raise_for_status()
         
@@ -233,151 +420,117 @@ class OPGG:
         if (return_content_only):
             return content
         
-        try:            
-            for season in content["summoner"]["previous_seasons"]:
-                tmp_season_info = None
-                if self.all_seasons:
-                    for _season in self.all_seasons:
-                        if _season.id == season["season_id"]:
-                            tmp_season_info = _season
-                            break
+        summoner_data = content["summoner"]
+        
+        try:
+            # page props did not return any recent games, lets query the /games endpoint instead
+            recent_game_stats: list[Game] = self.get_recent_games(summoner_id=summoner_id)
+        except (KeyError, TypeError, AttributeError) as e:
+            self.logger.error(
+                "Error parsing some summoner data... (Could be that they just come in as nulls...): %r", e,
+                exc_info=self.logger.isEnabledFor(logging.DEBUG)
+            )
+            recent_game_stats = []
+        except (requests.RequestException, ValueError) as e:
+            # a failing /games request (HTTP error, undecodable body) shouldn't cost the caller the whole summoner,
+            # nor abort the other summoners of a search()
+            self.logger.error(
+                "Unable to fetch recent games, returning the summoner without them: %r", e,
+                exc_info=self.logger.isEnabledFor(logging.DEBUG)
+            )
+            recent_game_stats = []
+        
+        return Summoner(
+            *_summoner_getter(summoner_data),
+            recent_game_stats = recent_game_stats,
+            # the remaining collections are only parsed once they're accessed on the summoner
+            loaders = {
+                "previous_seasons": partial(self._parse_previous_seasons, summoner_data),
+                "league_stats": partial(self._parse_league_stats, summoner_data),
+                "most_champions": partial(self._parse_most_champions, summoner_data),
+            }
+        )
+    
+    
+    def _parse_previous_seasons(self, summoner_data: dict) -> list[Season]:
+        """
+        Build the `Season` objects of a summoner's /summary payload.
+        """
+        previous_seasons: list[Season] = []
+        # built once per list of seasons (shared with Utils.get_season_by), instead of scanning it for every season
+        seasons_by_id = Utils._index("season", self.all_seasons, "id") if self.all_seasons else {}
+        
+        try:
+            for season in summoner_data["previous_seasons"]:
+                tmp_season_info = seasons_by_id.get(season["season_id"])
                 
                 tmp_rank_entries = []
                 for rank_entry in season["rank_entries"]:
-                    if rank_entry["rank_info"] is None:
+                    rank_info = rank_entry["rank_info"]
+                    if rank_info is None:
                         continue
                     tmp_rank_entries.append(RankEntry(
                         game_type = rank_entry["game_type"],
                         rank_info = Tier(
-                            tier=rank_entry["rank_info"]["tier"],
-                            division=rank_entry["rank_info"]["division"],
-                            lp=rank_entry["rank_info"]["lp"],
+                            tier=rank_info["tier"],
+                            division=rank_info["division"],
+                            lp=rank_info["lp"],
                         ),
                         created_at = datetime.fromisoformat(rank_entry["created_at"]) if rank_entry["created_at"] else None,
                     ))
                 
                 previous_seasons.append(Season(
                     season_id = tmp_season_info,
-                    tier_info = Tier(
-                        tier = season["tier_info"]["tier"],
-                        division = season["tier_info"]["division"],
-                        lp = season["tier_info"]["lp"],
-                        tier_image_url = season["tier_info"]["tier_image_url"],
-                        border_image_url = season["tier_info"]["border_image_url"]
-                    ),
+                    tier_info = Tier(*_season_tier_getter(season["tier_info"])),
                     rank_entries = tmp_rank_entries,
                     created_at = datetime.fromisoformat(season["created_at"]) if season["created_at"] else None
                 ))
-            
-            for league in content["summoner"]["league_stats"]:
+        except (KeyError, TypeError, AttributeError) as e:
+            self._log_parse_error(e)
+        
+        return previous_seasons
+    
+    
+    def _parse_league_stats(self, summoner_data: dict) -> list[LeagueStats]:
+        """
+        Build the `LeagueStats` objects of a summoner's /summary payload.
+        """
+        league_stats: list[LeagueStats] = []
+        
+        try:
+            for league in summoner_data["league_stats"]:
                 league_stats.append(LeagueStats(
-                    queue_info = QueueInfo(
-                        id = league["queue_info"]["id"],
-                        queue_translate = league["queue_info"]["queue_translate"],
-                        game_type = league["queue_info"]["game_type"]
-                    ),
-                    tier_info = Tier(
-                        tier = league["tier_info"]["tier"],
-                        division = league["tier_info"]["division"],
-                        lp = league["tier_info"]["lp"],
-                        tier_image_url = league["tier_info"]["tier_image_url"],
-                        border_image_url = league["tier_info"]["border_image_url"],
-                        level = league["tier_info"]["level"]
-                    ),
-                    win = league["win"],
-                    lose = league["lose"],
-                    is_hot_streak = league["is_hot_streak"],
-                    is_fresh_blood = league["is_fresh_blood"],
-                    is_veteran = league["is_veteran"],
-                    is_inactive = league["is_inactive"],
-                    series = league["series"],
-                    updated_at = league["updated_at"]
-                ))
-            
-            for champion in content["summoner"]["most_champions"]["champion_stats"]:
-                tmp_champ = None
-                if self.all_champions:
-                    for _champion in self.all_champions:
-                        if _champion.id == champion["id"]:
-                            tmp_champ = _champion
-                            break
-                
-                most_champions.append(ChampionStats(
-                    champion = tmp_champ,
-                    id = champion["id"],
-                    play = champion["play"],
-                    win = champion["win"],
-                    lose = champion["lose"],
-                    kill = champion["kill"],
-                    death = champion["death"],
-                    assist = champion["assist"],
-                    gold_earned = champion["gold_earned"],
-                    minion_kill = champion["minion_kill"],
-                    turret_kill = champion["turret_kill"],
-                    neutral_minion_kill = champion["neutral_minion_kill"],
-                    damage_dealt = champion["damage_dealt"],
-                    damage_taken = champion["damage_taken"],
-                    physical_damage_dealt = champion["physical_damage_dealt"],
-                    magic_damage_dealt = champion["magic_damage_dealt"],
-                    most_kill = champion["most_kill"],
-                    max_kill = champion["max_kill"],
-                    max_death = champion["max_death"],
-                    double_kill = champion["double_kill"],
-                    triple_kill = champion["triple_kill"],
-                    quadra_kill = champion["quadra_kill"],
-                    penta_kill = champion["penta_kill"],
-                    game_length_second = champion["game_length_second"],
-                    inhibitor_kills = champion["inhibitor_kills"],
-                    sight_wards_bought_in_game = champion["sight_wards_bought_in_game"],
-                    vision_wards_bought_in_game = champion["vision_wards_bought_in_game"],
-                    vision_score = champion["vision_score"],
-                    wards_placed = champion["wards_placed"],
-                    wards_killed = champion["wards_killed"],
-                    heal = champion["heal"],
-                    time_ccing_others = champion["time_ccing_others"],
-                    op_score = champion["op_score"],
-                    is_max_in_team_op_score = champion["is_max_in_team_op_score"],
-                    physical_damage_taken = champion["physical_damage_taken"],
-                    damage_dealt_to_champions = champion["damage_dealt_to_champions"],
-                    physical_damage_dealt_to_champions = champion["physical_damage_dealt_to_champions"],
-                    magic_damage_dealt_to_champions = champion["magic_damage_dealt_to_champions"],
-                    damage_dealt_to_objectives = champion["damage_dealt_to_objectives"],
-                    damage_dealt_to_turrets = champion["damage_dealt_to_turrets"],
-                    damage_self_mitigated = champion["damage_self_mitigated"],
-                    max_largest_multi_kill = champion["max_largest_multi_kill"],
-                    max_largest_critical_strike = champion["max_largest_critical_strike"],
-                    max_largest_killing_spree = champion["max_largest_killing_spree"],
-                    snowball_throws = champion["snowball_throws"],
-                    snowball_hits = champion["snowball_hits"],
+                    QueueInfo(*_queue_info_getter(league["queue_info"])),
+                    Tier(*_tier_getter(league["tier_info"])),
+                    *_league_stats_getter(league)
                 ))
-            
-            # page props did not return any recent games, lets query the /games endpoint instead
-            # gets the summoner id from the objects internal self._game_api_url's self.summoner_id ref
-            recent_game_stats: Game | list[Game] = self.get_recent_games()
-                
-                
-        except Exception:
-            self.logger.error(f"Error parsing some summoner data... (Could be that they just come in as nulls...): {traceback.format_exc()}")
-            pass
+        except (KeyError, TypeError, AttributeError) as e:
+            self._log_parse_error(e)
         
+        return league_stats
+    
+    
+    def _parse_most_champions(self, summoner_data: dict) -> list[ChampionStats]:
+        """
+        Build the `ChampionStats` objects of a summoner's /summary payload.
+        """
+        most_champions: list[ChampionStats] = []
+        # same index Utils.get_champion_by(By.ID) uses, so it's only built once per list of champions
+        champions_by_id = Utils._index("champion", self.all_champions, "id") if self.all_champions else {}
         
-        return Summoner(
-            id = content["summoner"]["id"],
-            summoner_id = content["summoner"]["summoner_id"],
-            acct_id = content["summoner"]["acct_id"],
-            puuid = content["summoner"]["puuid"],
-            game_name = content["summoner"]["game_name"],
-            tagline = content["summoner"]["tagline"],
-            name = content["summoner"]["name"],
-            internal_name = content["summoner"]["internal_name"],
-            profile_image_url = content["summoner"]["profile_image_url"],
-            level = content["summoner"]["level"],
-            updated_at = content["summoner"]["updated_at"],
-            renewable_at = content["summoner"]["renewable_at"],
-            previous_seasons = previous_seasons,
-            league_stats = league_stats,
-            most_champions = most_champions,
-            recent_game_stats = recent_game_stats
+        try:
+            for champion in summoner_data["most_champions"]["champion_stats"]:
+                most_champions.append(ChampionStats(champions_by_id.get(champion["id"]), *_champion_stats_getter(champion)))
+        except (KeyError, TypeError, AttributeError) as e:
+            self._log_parse_error(e)
+        
+        return most_champions
+    
+    
+    def _log_parse_error(self, e: Exception) -> None:
+        self.logger.error(
+            "Error parsing some summoner data... (Could be that they just come in as nulls...): %r", e,
+            exc_info=self.logger.isEnabledFor(logging.DEBUG)
         )
     
     
@@ -400,6 +553,9 @@ class OPGG:
             summoner_names = summoner_names.split(",")
         elif isinstance(summoner_names, str):
             summoner_names = [summoner_names]
+        
+        # the same name passed twice would otherwise be looked up, fetched and built twice (order preserving)
+        summoner_names = list(dict.fromkeys(summoner_names))
             
         # General flow of cache retrieval:
         # 1. Pull from cache db
@@ -414,21 +570,25 @@ class OPGG:
         for summoner_name in summoner_names:
             if ('#' not in summoner_name):
                 raise Exception(f"No regional identifier was found for query: \"{summoner_name}\". Please include the identifier as well and try again. (#NA1, #EUW, etc.)")
-            cached_id = self.cacher.get_summoner_id(summoner_name)
+        
+        # one lookup for the whole batch, rather than a query per name
+        for summoner_name, cached_id in self.cacher.get_summoner_ids(summoner_names).items():
             if cached_id:
                 cached_summoner_ids.append(cached_id)
             else:
                 uncached_summoners.append(summoner_name)
         
-        # pass only uncached summoners to get_page_props()
-        page_props = Utils.get_page_props(uncached_summoners, region)
+        # pass only uncached summoners to get_page_props(), when every summoner is cached there's nothing to scrape
+        # (champs/seasons below fetch their own data if they aren't cached either)
+        page_props = Utils.get_page_props(uncached_summoners, region) if uncached_summoners else None
         
-        self.logger.debug(f"\n********PAGE_PROPS_START********\n{page_props}\n********PAGE_PROPS_STOP********")
+        # %-style, so the (very large) page props are only formatted when debug logging is on
+        self.logger.debug("\n********PAGE_PROPS_START********\n%s\n********PAGE_PROPS_STOP********", page_props)
         
         if len(uncached_summoners) > 0:
-            self.logger.info(f"No cache for {len(uncached_summoners)} summoners: {uncached_summoners}, fetching... (using get_page_props() site scraper)")
+            self.logger.info("No cache for %d summoners: %s, fetching... (using get_page_props() site scraper)", len(uncached_summoners), uncached_summoners)
         if len(cached_summoner_ids) > 0:
-            self.logger.info(f"Cache found for {len(cached_summoner_ids)} summoners: {cached_summoner_ids}, fetching... (using get_summoner() api)")
+            self.logger.info("Cache found for %d summoners: %s, fetching... (using get_summoner() api)", len(cached_summoner_ids), cached_summoner_ids)
         
         # Query cache for champs and seasons
         cached_seasons = self.cacher.get_all_seasons()
@@ -455,34 +615,52 @@ class OPGG:
         
         # bit of weirdness around generic usernames. If you pass "abc" for example, it will return multiple summoners in the page props.
         # To help, we will check against opgg's "internal_name" property, which seems to be the username.lower() with spaces removed.        
-        summoners = []
-        for summoner_name in summoner_names:
+        summoner_ids = []
+        # only the uncached names were searched for, cached ones resolving against these page props would pick up
+        # someone else's summoner id
+        for summoner_name in uncached_summoners:
             # if there are multiple search results for a SINGLE summoner_name, query MUST include the regional identifier
             if (len(page_props["summoners"]) > 1 and '#' in summoner_name):
-                logging.debug(f"MULTI-RESULT | page_props->summoners: {page_props['summoners']}")
-                only_summoner_name, only_region = summoner_name.split("#")
+                self.logger.debug("MULTI-RESULT | page_props->summoners: %s", page_props["summoners"])
+                # one pass over the name, stripped once rather than per search result compared against
+                only_summoner_name, _, only_region = summoner_name.partition("#")
+                only_summoner_name, only_region = only_summoner_name.strip(), only_region.strip()
                 for summoner in page_props["summoners"]:
-                    if (only_summoner_name.strip() == summoner["game_name"] and only_region.strip() == summoner["tagline"]):
-                        self.summoner_id = summoner["summoner_id"]
+                    if (only_summoner_name == summoner["game_name"] and only_region == summoner["tagline"]):
+                        summoner_ids.append(summoner["summoner_id"])
                         break
             
             elif (len(page_props["summoners"]) > 1 and '#' not in summoner_name):
                 raise Exception(f"Multiple search results were returned for \"{summoner_name}\". Please include the identifier as well and try again. (#NA1, #EUW, etc.)")
 
             elif (len(page_props["summoners"]) == 1):
-                self.summoner_id = page_props["summoners"][0]["summoner_id"]
-            
-            summoner = self.get_summoner()
-            summoners.append(summoner)
-            self.logger.info(f"Summoner object built for: {summoner.name} ({summoner.summoner_id}), caching...")
-            self.cacher.insert_summoner(summoner.name, summoner.summoner_id)
-            
+                summoner_ids.append(page_props["summoners"][0]["summoner_id"])
+        
+        # several names can resolve to the same summoner (e.g. a single page props result), keep the first of each
+        summoner_ids = list(dict.fromkeys(summoner_ids))
+        uncached_count = len(summoner_ids)
         # cached summoners go straight to api
-        for _cached_summoner_id in cached_summoner_ids:
-            self.summoner_id = _cached_summoner_id
-            summoner = self.get_summoner()
-            summoners.append(summoner)
-            self.logger.info(f"Summoner object built for: {summoner.name} ({summoner.summoner_id})")
+        summoner_ids.extend(cached_summoner_ids)
+        
+        # Each summoner is a /summary + /games round trip, so fetch them concurrently instead of one after the other.
+        # get_summoner(summoner_id=...) leaves the instance untouched, the threads only share the (read-only) champs/seasons.
+        summoners = []
+        if summoner_ids:
+            # (runs on the shared pool, so repeat searches reuse its threads)
+            summoners = list(Utils._get_executor().map(lambda summoner_id: self.get_summoner(summoner_id=summoner_id), summoner_ids))
+            
+            # keep the instance pointing at the last summoner, as if they had been fetched one by one
+            self.summoner_id = summoner_ids[-1]
+        
+        for i, summoner in enumerate(summoners):
+            if i < uncached_count:
+                self.logger.info("Summoner object built for: %s (%s), caching...", summoner.name, summoner.summoner_id)
+            else:
+                self.logger.info("Summoner object built for: %s (%s)", summoner.name, summoner.summoner_id)
+        
+        # cache every newly resolved summoner in one go, written in the background so the caller isn't held up by disk I/O
+        if uncached_count > 0:
+            self.cacher.queue_summoners([(summoner.name, summoner.summoner_id) for summoner in summoners[:uncached_count]])
         
         # todo: add custom exceptions instead of this.
         # todo: raise SummonerNotFound exception
@@ -492,240 +670,40 @@ class OPGG:
         return summoners if len(summoners) > 1 else summoners[0]
 
     
-    def get_recent_games(self, results: int = 10, game_type: Literal["total", "ranked", "normal"] = "total", return_content_only = False) -> list[Game]:
-        recent_games = []
-        res = requests.get(f"{self._games_api_url}?&limit={results}&game_type={game_type}", headers=self.headers)
+    def get_recent_games(self, results: int = 10, game_type: Literal["total", "ranked", "normal"] = "total", return_content_only = False, summoner_id: str | None = None) -> list[Game]:
+        games_api_url = self._games_api_url if summoner_id is None else _build_games_url(self.region, summoner_id)
+        res = Utils.request("GET", f"{games_api_url}?&limit={results}&game_type={game_type}", headers=self.headers)
         
-        self.logger.debug(res.text)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(res.text)
         
         if res.status_code == 200:
-            self.logger.info(f"Request to OPGG GAME_API was successful, parsing data (Content Length: {len(res.text)})...")
-            game_data: Game = json.loads(res.text)["data"]
+            self.logger.info("Request to OPGG GAME_API was successful, parsing data (Content Length: %d)...", len(res.content))
+            game_data: Game = orjson.loads(res.content)["data"]
         else:
             res.raise_for_status()
         
         if return_content_only:
             return game_data
         
-        try:
-            for game in game_data:                
-                participants = []
-                for participant in game["participants"]:
-                    participants.append(Participant(
-                        summoner=Summoner(
-                            id=participant["summoner"]["id"],
-                            summoner_id=participant["summoner"]["summoner_id"],
-                            acct_id=participant["summoner"]["acct_id"],
-                            puuid=participant["summoner"]["puuid"],
-                            game_name=participant["summoner"]["game_name"],
-                            tagline=participant["summoner"]["tagline"],
-                            name=participant["summoner"]["name"],
-                            internal_name=participant["summoner"]["internal_name"],
-                            profile_image_url=participant["summoner"]["profile_image_url"],
-                            level=participant["summoner"]["level"],
-                            updated_at=participant["summoner"]["updated_at"],
-                            renewable_at=participant["summoner"]["renewable_at"]
-                        ),
-                        participant_id=participant["participant_id"],
-                        champion_id=participant["champion_id"],
-                        team_key=participant["team_key"],
-                        position=participant["position"],
-                        role=participant["role"],
-                        items=participant["items"],
-                        trinket_item=participant["trinket_item"],
-                        rune={
-                            participant["rune"]["primary_page_id"],
-                            participant["rune"]["primary_rune_id"],
-                            participant["rune"]["secondary_page_id"]
-                        }, # temp, eventually turn this into an object..?
-                        spells=participant["spells"],
-                        stats=Stats(
-                            champion_level=participant["stats"]["champion_level"],
-                            damage_self_mitigated=participant["stats"]["damage_self_mitigated"],
-                            damage_dealt_to_objectives=participant["stats"]["damage_dealt_to_objectives"],
-                            damage_dealt_to_turrets=participant["stats"]["damage_dealt_to_turrets"],
-                            magic_damage_dealt_player=participant["stats"]["magic_damage_dealt_player"],
-                            physical_damage_taken=participant["stats"]["physical_damage_taken"],
-                            physical_damage_dealt_to_champions=participant["stats"]["physical_damage_dealt_to_champions"],
-                            total_damage_taken=participant["stats"]["total_damage_taken"],
-                            total_damage_dealt=participant["stats"]["total_damage_dealt"],
-                            total_damage_dealt_to_champions=participant["stats"]["total_damage_dealt_to_champions"],
-                            largest_critical_strike=participant["stats"]["largest_critical_strike"],
-                            time_ccing_others=participant["stats"]["time_ccing_others"],
-                            vision_score=participant["stats"]["vision_score"],
-                            vision_wards_bought_in_game=participant["stats"]["vision_wards_bought_in_game"],
-                            sight_wards_bought_in_game=participant["stats"]["sight_wards_bought_in_game"],
-                            ward_kill=participant["stats"]["ward_kill"],
-                            ward_place=participant["stats"]["ward_place"],
-                            turret_kill=participant["stats"]["champion_level"],
-                            barrack_kill=participant["stats"]["barrack_kill"],
-                            kill=participant["stats"]["kill"],
-                            death=participant["stats"]["death"],
-                            assist=participant["stats"]["assist"],
-                            largest_multi_kill=participant["stats"]["largest_multi_kill"],
-                            largest_killing_spree=participant["stats"]["largest_killing_spree"],
-                            minion_kill=participant["stats"]["minion_kill"],
-                            neutral_minion_kill_team_jungle=participant["stats"]["neutral_minion_kill_team_jungle"],
-                            neutral_minion_kill_enemy_jungle=participant["stats"]["neutral_minion_kill_enemy_jungle"],
-                            neutral_minion_kill=participant["stats"]["neutral_minion_kill"],
-                            gold_earned=participant["stats"]["gold_earned"],
-                            total_heal=participant["stats"]["total_heal"],
-                            result=participant["stats"]["result"],
-                            op_score=participant["stats"]["op_score"],
-                            op_score_rank=participant["stats"]["op_score_rank"],
-                            is_opscore_max_in_team=participant["stats"]["is_opscore_max_in_team"],
-                            lane_score=participant["stats"]["lane_score"],
-                            op_score_timeline=participant["stats"]["op_score_timeline"],
-                            op_score_timeline_analysis=participant["stats"]["op_score_timeline_analysis"],
-                        ),
-                        tier_info=Tier(
-                            tier=participant["tier_info"]["tier"],
-                            division=participant["tier_info"]["division"],
-                            lp=participant["tier_info"]["lp"],
-                            level=participant["tier_info"]["level"],
-                            tier_image_url=participant["tier_info"]["tier_image_url"],
-                            border_image_url=participant["tier_info"]["border_image_url"],
-                        )
-                    ))
-                
-                teams = []
-                for team in game["teams"]:
-                    teams.append(Team(
-                        key=team["key"],
-                        game_stat=GameStats(
-                            is_win=team["game_stat"]["is_win"],
-                            champion_kill=team["game_stat"]["champion_kill"],
-                            champion_first=team["game_stat"]["champion_first"],
-                            inhibitor_kill=team["game_stat"]["inhibitor_kill"],
-                            inhibitor_first=team["game_stat"]["inhibitor_first"],
-                            rift_herald_kill=team["game_stat"]["rift_herald_kill"],
-                            rift_herald_first=team["game_stat"]["rift_herald_first"],
-                            dragon_kill=team["game_stat"]["dragon_kill"],
-                            dragon_first=team["game_stat"]["dragon_first"],
-                            baron_kill=team["game_stat"]["baron_kill"],
-                            baron_first=team["game_stat"]["baron_first"],
-                            tower_kill=team["game_stat"]["tower_kill"],
-                            tower_first=team["game_stat"]["tower_first"],
-                            horde_kill=team["game_stat"]["horde_kill"],
-                            horde_first=team["game_stat"]["horde_first"],
-                            is_remake=team["game_stat"]["is_remake"],
-                            death=team["game_stat"]["death"],
-                            assist=team["game_stat"]["assist"],
-                            gold_earned=team["game_stat"]["gold_earned"],
-                            kill=team["game_stat"]["kill"],
-                        ),
-                        banned_champions=team["banned_champions"]
-                    ))
-                
-                tmp_game = Game(
-                    id = game["id"],
-                    created_at=game["created_at"],
-                    game_map=game["game_map"],
-                    queue_info=QueueInfo(
-                        id=game["queue_info"]["id"],
-                        queue_translate=game["queue_info"]["queue_translate"],
-                        game_type=game["queue_info"]["game_type"],
-                    ),
-                    version=game["version"],
-                    game_length_second=game["game_length_second"],
-                    is_remake=game["is_remake"],
-                    is_opscore_active=game["is_opscore_active"],
-                    is_recorded=game["is_recorded"],
-                    record_info=game["record_info"],
-                    average_tier_info=Tier(
-                        tier=game["average_tier_info"]["tier"],
-                        division=game["average_tier_info"]["division"],
-                        tier_image_url=game["average_tier_info"]["tier_image_url"],
-                        border_image_url=game["average_tier_info"]["border_image_url"],
-                    ),
-                    participants=participants,
-                    teams=teams,
-                    memo=game["memo"],
-                    myData=Participant(
-                        summoner=Summoner(
-                            id=game["myData"]["summoner"]["id"],
-                            summoner_id=game["myData"]["summoner"]["summoner_id"],
-                            acct_id=game["myData"]["summoner"]["acct_id"],
-                            puuid=game["myData"]["summoner"]["puuid"],
-                            game_name=game["myData"]["summoner"]["game_name"],
-                            tagline=game["myData"]["summoner"]["tagline"],
-                            name=game["myData"]["summoner"]["name"],
-                            internal_name=game["myData"]["summoner"]["internal_name"],
-                            profile_image_url=game["myData"]["summoner"]["profile_image_url"],
-                            level=game["myData"]["summoner"]["level"],
-                            updated_at=game["myData"]["summoner"]["updated_at"],
-                            renewable_at=game["myData"]["summoner"]["renewable_at"]
-                        ),
-                        participant_id=game["myData"]["participant_id"],
-                        champion_id=game["myData"]["champion_id"],
-                        team_key=game["myData"]["team_key"],
-                        position=game["myData"]["position"],
-                        role=game["myData"]["role"],
-                        items=game["myData"]["items"],
-                        trinket_item=game["myData"]["trinket_item"],
-                        rune={
-                            game["myData"]["rune"]["primary_page_id"],
-                            game["myData"]["rune"]["primary_rune_id"],
-                            game["myData"]["rune"]["secondary_page_id"]
-                        }, # temp, eventually turn this into an object..?
-                        spells=game["myData"]["spells"],
-                        stats=Stats(
-                            champion_level=game["myData"]["stats"]["champion_level"],
-                            damage_self_mitigated=game["myData"]["stats"]["damage_self_mitigated"],
-                            damage_dealt_to_objectives=game["myData"]["stats"]["damage_dealt_to_objectives"],
-                            damage_dealt_to_turrets=game["myData"]["stats"]["damage_dealt_to_turrets"],
-                            magic_damage_dealt_player=game["myData"]["stats"]["magic_damage_dealt_player"],
-                            physical_damage_taken=game["myData"]["stats"]["physical_damage_taken"],
-                            physical_damage_dealt_to_champions=game["myData"]["stats"]["physical_damage_dealt_to_champions"],
-                            total_damage_taken=game["myData"]["stats"]["total_damage_taken"],
-                            total_damage_dealt=game["myData"]["stats"]["total_damage_dealt"],
-                            total_damage_dealt_to_champions=game["myData"]["stats"]["total_damage_dealt_to_champions"],
-                            largest_critical_strike=game["myData"]["stats"]["largest_critical_strike"],
-                            time_ccing_others=game["myData"]["stats"]["time_ccing_others"],
-                            vision_score=game["myData"]["stats"]["vision_score"],
-                            vision_wards_bought_in_game=game["myData"]["stats"]["vision_wards_bought_in_game"],
-                            sight_wards_bought_in_game=game["myData"]["stats"]["sight_wards_bought_in_game"],
-                            ward_kill=game["myData"]["stats"]["ward_kill"],
-                            ward_place=game["myData"]["stats"]["ward_place"],
-                            turret_kill=game["myData"]["stats"]["champion_level"],
-                            barrack_kill=game["myData"]["stats"]["barrack_kill"],
-                            kill=game["myData"]["stats"]["kill"],
-                            death=game["myData"]["stats"]["death"],
-                            assist=game["myData"]["stats"]["assist"],
-                            largest_multi_kill=game["myData"]["stats"]["largest_multi_kill"],
-                            largest_killing_spree=game["myData"]["stats"]["largest_killing_spree"],
-                            minion_kill=game["myData"]["stats"]["minion_kill"],
-                            neutral_minion_kill_team_jungle=game["myData"]["stats"]["neutral_minion_kill_team_jungle"],
-                            neutral_minion_kill_enemy_jungle=game["myData"]["stats"]["neutral_minion_kill_enemy_jungle"],
-                            neutral_minion_kill=game["myData"]["stats"]["neutral_minion_kill"],
-                            gold_earned=game["myData"]["stats"]["gold_earned"],
-                            total_heal=game["myData"]["stats"]["total_heal"],
-                            result=game["myData"]["stats"]["result"],
-                            op_score=game["myData"]["stats"]["op_score"],
-                            op_score_rank=game["myData"]["stats"]["op_score_rank"],
-                            is_opscore_max_in_team=game["myData"]["stats"]["is_opscore_max_in_team"],
-                            lane_score=game["myData"]["stats"]["lane_score"],
-                            op_score_timeline=game["myData"]["stats"]["op_score_timeline"],
-                            op_score_timeline_analysis=game["myData"]["stats"]["op_score_timeline_analysis"],
-                        ),
-                        tier_info=Tier(
-                            tier=game["myData"]["tier_info"]["tier"],
-                            division=game["myData"]["tier_info"]["division"],
-                            lp=game["myData"]["tier_info"]["lp"],
-                            level=game["myData"]["tier_info"]["level"],
-                            tier_image_url=game["myData"]["tier_info"]["tier_image_url"],
-                            border_image_url=game["myData"]["tier_info"]["border_image_url"],
-                        )
-                    )
-                )
-                
-                recent_games.append(tmp_game)
-                
-            return recent_games
-        
-        except:
-            self.logger.error(f"Unable to create game object, see trace: \n{traceback.format_exc()}")
-            pass
+        return _build_games(game_data)
     
-
-    
\ No newline at end of file
+    
+    def get_game_batch(self, results: int = 10, game_type: Literal["total", "ranked", "normal"] = "total", summoner_id: str | None = None) -> GameBatch:
+        """
+        Fetch recent games straight into a columnar `GameBatch` (no `Game`/`Participant` objects), for aggregate stats.
+        
+        ### Args:
+            results : `int, optional`
+                Number of games to fetch. Defaults to 10.
+            
+            game_type : `Literal["total", "ranked", "normal"], optional`
+                Type of games to fetch. Defaults to "total".
+            
+            summoner_id : `str, optional`
+                Fetch this summoner id instead of the instance's `summoner_id`.
+        
+        ### Returns:
+            `GameBatch` : A GameBatch with one row per participant of every game.
+        """
+        return GameBatch.from_games(self.get_recent_games(results, game_type, return_content_only=True, summoner_id=summoner_id))
@@ -4,10 +4,12 @@
 # Date    : 2023-07-05
 # License : BSD-3-Clause
 
+from enum import IntEnum, StrEnum
 
-class Region:
+
+class Region(StrEnum):
     """
-    Struct for regions.
+    Enum for regions.
     
     ### Options:
         `NA` - North America\n
@@ -36,9 +38,9 @@ class Region:
     TR = "TR"
 
 
-class By:
+class By(StrEnum):
     """
-    Struct for search-by or match-by types.
+    Enum for search-by or match-by types.
     
     ### Options:
         `ID` - Generic ID\n
@@ -57,9 +59,9 @@ class By:
     RIOT_POINTS = "RP"
     
 
-class Queue:
+class Queue(StrEnum):
     """
-    Struct for queue types.
+    Enum for queue types.
     
     ### Options:
         `SOLO` - SoloQueue\n
@@ -70,4 +72,39 @@ class Queue:
     SOLO = "SOLORANKED"
     FLEX = "FLEXRANKED"
     ARENA = "ARENA"
-    
\ No newline at end of file
+
+
+class TeamKey(IntEnum):
+    """
+    Enum for team keys, as compact integer codes. (Used by the `GameBatch` columns)
+    
+    ### Options:
+        `UNKNOWN` - Any other / missing team key\n
+        `BLUE` - Blue side\n
+        `RED` - Red side
+    """
+    
+    UNKNOWN = -1
+    BLUE = 0
+    RED = 1
+
+
+class Position(IntEnum):
+    """
+    Enum for positions, as compact integer codes. (Used by the `GameBatch` columns)
+    
+    ### Options:
+        `UNKNOWN` - No position (ARAM, Arena, etc.)\n
+        `TOP` - Top lane\n
+        `JUNGLE` - Jungle\n
+        `MID` - Mid lane\n
+        `ADC` - Bot lane carry\n
+        `SUPPORT` - Support
+    """
+    
+    UNKNOWN = -1
+    TOP = 0
+    JUNGLE = 1
+    MID = 2
+    ADC = 3
+    SUPPORT = 4
@@ -5,8 +5,13 @@
 # License : BSD-3-Clause
 
 
+import logging
+import sys
+
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from operator import attrgetter, itemgetter
+from typing import Any, Callable
 from opgg.game import Stats, Team
 from opgg.params import By, Queue
 from opgg.season import Season
@@ -14,11 +19,94 @@ from opgg.league_stats import LeagueStats, QueueInfo, Tier
 from opgg.champion import Champion, ChampionStats
 from opgg.utils import Utils
 
+_logger = logging.getLogger("OPGG.py")
+
 # left/right just factor
 LJF = 18
 RJF = 14
 
+# constant repr columns, computed once instead of on every Summoner.__repr__ call
+PAD = "".ljust(LJF+RJF)
+
+# (preformatted "label (type) | " prefix, attribute) rows of Summoner.__repr__
+_ROWS = tuple(
+    (f"{label.ljust(LJF)} {f'({_type})'.rjust(RJF)} | ", attr) for label, _type, attr in (
+        ("Id", "int", "id"),
+        ("Summoner Id", "str", "summoner_id"),
+        ("Account Id", "str", "acct_id"),
+        ("Puuid", "str", "puuid"),
+        ("Game Name", "str", "game_name"),
+        ("Tagline", "str", "tagline"),
+        ("Name", "str", "name"),
+        ("Internal Name", "str", "internal_name"),
+        ("Profile Image Url", "str", "profile_image_url"),
+        ("Level", "int", "level"),
+        ("Updated At", "datetime", "updated_at"),
+        ("Renewable At", "datetime", "renewable_at"),
+    )
+)
+# Header + scalar rows as one positional str.format template, filled from a single attrgetter call
+_ROW_ATTRS = tuple(attr for _, attr in _ROWS)
+_REPR_TEMPLATE = f"[Summoner: {{{_ROW_ATTRS.index('game_name')}}}]\n{'-' * 80}\n" + "".join(
+    f"{prefix}{{{i}}}\n" for i, (prefix, _) in enumerate(_ROWS)
+)
+_row_getter = attrgetter(*_ROW_ATTRS)
+
+_LIST_ROWS = tuple(
+    (f"{label.ljust(LJF)} {f'({_type})'.rjust(RJF)} | ", attr) for label, _type, attr in (
+        ("Previous Seasons", "Season", "previous_seasons"),
+        ("League Stats", "LeagueStats", "league_stats"),
+        ("Most Champions", "ChampStats", "most_champions"),
+        ("Recent Game Stats", "Game", "recent_game_stats"),
+    )
+)
+
+def _intern(value: str | None) -> str | None:
+    """
+    `sys.intern` for the low-cardinality string fields (team key, position, role, map...), passing None through.
+    """
+    return sys.intern(value) if value.__class__ is str else value
+
+
+# Field names in the positional order of their model's __init__, read with a single itemgetter call per object.
+_SUMMONER_FIELDS = (
+    "id", "summoner_id", "acct_id", "puuid", "game_name", "tagline", "name", "internal_name", 
+    "profile_image_url", "level", "updated_at", "renewable_at"
+)
+_STATS_FIELDS = (
+    "champion_level", "damage_self_mitigated", "damage_dealt_to_objectives", "damage_dealt_to_turrets", 
+    "magic_damage_dealt_player", "physical_damage_taken", "physical_damage_dealt_to_champions", 
+    "total_damage_taken", "total_damage_dealt", "total_damage_dealt_to_champions", "largest_critical_strike", 
+    "time_ccing_others", "vision_score", "vision_wards_bought_in_game", "sight_wards_bought_in_game", 
+    "ward_kill", "ward_place", "turret_kill", "barrack_kill", "kill", "death", "assist", "largest_multi_kill", 
+    "largest_killing_spree", "minion_kill", "neutral_minion_kill_team_jungle", "neutral_minion_kill_enemy_jungle", 
+    "neutral_minion_kill", "gold_earned", "total_heal", "result", "op_score", "op_score_rank", 
+    "is_opscore_max_in_team", "lane_score", "op_score_timeline", "op_score_timeline_analysis"
+)
+_TIER_FIELDS = ("tier", "division", "tier_image_url", "border_image_url", "lp", "level")
+
+_summoner_getter = itemgetter(*_SUMMONER_FIELDS)
+_stats_getter = itemgetter(*_STATS_FIELDS)
+_tier_getter = itemgetter(*_TIER_FIELDS)
+
+
+def _dedup(cache: dict | None, cls: type, values: tuple):
+    """
+    Return the `cls(*values)` already built for the same values in this batch, or build and remember it.\n
+    Without a cache (None) the object is simply built.
+    """
+    if cache is None:
+        return cls(*values)
+    
+    key = (cls, values)
+    obj = cache.get(key)
+    if obj is None:
+        obj = cache[key] = cls(*values)
+    return obj
+
 
+# identity equality / default repr are kept, a participant's repr would otherwise pull in the full Summoner repr
+@dataclass(slots=True, eq=False, repr=False)
 class Participant:
     """
     Represents a participant in the game with detailed information about their performance and loadout.\n
@@ -30,171 +118,26 @@ class Participant:
         `team_key: str` - Key representing the participant's team\n
         `position: str` - Position played by the participant (e.g., Top, Mid, Bot)\n
         `role: str` - Role played by the participant (e.g., Carry, Support)\n
-        `items: list` - List of items acquired by the participant\n
+        `items: tuple[int, ...]` - Items acquired by the participant\n
         `trinket_item: int` - Identifier for the trinket item used by the participant\n
-        `rune: dict[str, int]` - Dictionary of runes used by the participant with their respective values\n
-        `spells: list` - List of spells used by the participant\n
+        `rune: tuple[int, int, int]` - Runes used by the participant (primary page, primary rune, secondary page)\n
+        `spells: tuple[int, ...]` - Spells used by the participant\n
         `stats: Stats` - Performance statistics of the participant\n
         `tier_info: Tier` - Tier information of the participant\n
     """
-    def __init__(self,
-                 summoner: 'Summoner',
-                 participant_id: int,
-                 champion_id: int,
-                 team_key: str,
-                 position: str,
-                 role: str,
-                 items: list,
-                 trinket_item: int,
-                 rune: dict[str, int], # temp. need to see if a Rune object is necessary
-                 spells: list,
-                 stats: Stats,
-                 tier_info: Tier) -> None:
-        self._summoner = summoner
-        self._participant_id = participant_id
-        self._champion_id = champion_id
-        self._team_key = team_key
-        self._position = position
-        self._role = role
-        self._items = items
-        self._trinket_item = trinket_item
-        self._rune = rune
-        self._spells = spells
-        self._stats = stats
-        self._tier_info = tier_info
-    
-    @property
-    def summoner(self) -> 'Summoner':
-        """
-        A `Summoner` object representing a summoner
-        """
-        return self._summoner
-    
-    @summoner.setter
-    def summoner(self, value: 'Summoner') -> None:
-        self._summoner = value
-    
-    @property
-    def participant_id(self) -> int:
-        """
-        An `int` representing the participant id
-        """
-        return self._participant_id
-    
-    @participant_id.setter
-    def participant_id(self, value: int) -> None:
-        self._participant_id = value
-        
-    @property
-    def champion_id(self) -> int:
-        """
-        An `int` representing the champion id
-        """
-        return self._champion_id
-    
-    @champion_id.setter
-    def champion_id(self, value: int) -> None:
-        self._champion_id = value
-    
-    @property
-    def team_key(self) -> str:
-        """
-        A `str` representing the team (BLUE, RED)
-        """
-        return self._team_key
-    
-    @team_key.setter
-    def team_key(self, value: str) -> None:
-        self._team_key = value
-    
-    @property
-    def position(self) -> str:
-        """
-        A `str` representing the position the participant was playing
-        """
-        return self._position
-    
-    @position.setter
-    def position(self, value: str) -> None:
-        self._position = value
-    
-    @property
-    def role(self) -> str:
-        """
-        A `str` representing the role the participant was playing
-        """
-        return self._role
-    
-    @role.setter
-    def role(self, value: str) -> None:
-        self._role = value
-    
-    @property
-    def items(self) -> list[int]:
-        """
-        A `list[int]` representing the participants items
-        """
-        return self._items
-    
-    @items.setter
-    def items(self, value: list[int]) -> None:
-        self._items = value
-    
-    @property
-    def trinket_item(self) -> int:
-        """
-        An `int` representing the trinket item
-        """
-        return self._trinket_item
-    
-    @trinket_item.setter
-    def trinket_item(self, value: int) -> None:
-        self._trinket_item = value
-    
-    @property
-    def rune(self) -> dict[str, int]:
-        """
-        A `dict[str, int]` representing the rune configuration of the participant
-        """
-        return self._rune
-    
-    @rune.setter
-    def rune(self, value: dict[str, int]) -> None:
-        self._rune = value
-    
-    @property
-    def spells(self) -> list:
-        """
-        A `list` representing the spell configuration of the participant
-        """
-        return self._spells
-    
-    @spells.setter
-    def spells(self, value: list) -> None:
-        self._spells = value
-    
-    @property
-    def stats(self) -> Stats:
-        """
-        A `Stats` object representing the participants game stats
-        """
-        return self._stats
-    
-    @stats.setter
-    def stats(self, value: Stats) -> None:
-        self._stats = value
-    
-    @property
-    def tier_info(self) -> Tier:
-        """
-        A `Tier` object representing the participants league tier
-        """
-        return self._tier_info
-    
-    @tier_info.setter
-    def tier_info(self, value: Tier) -> None:
-        self._tier_info = value
-    
+    summoner: 'Summoner'
+    participant_id: int
+    champion_id: int
+    team_key: str
+    position: str
+    role: str
+    items: tuple[int, ...]
+    trinket_item: int
+    rune: tuple[int, int, int] # temp. need to see if a Rune object is necessary
+    spells: tuple[int, ...]
+    stats: Stats
+    tier_info: Tier
+
 
 class Game:
     """
@@ -215,8 +158,19 @@ class Game:
         `participants: list[Participant]` - A list of all participant in the game\n
         `teams: list[Team]` - A list of teams in the game\n
         `memo: Any` - Unknown return value and type\n
-        `myData: Participant` - User specific participant data
+        `myData: Participant` - User specific participant data\n
+    
+    Note: When built from the games endpoint, `participants` and `myData` are kept as raw dicts and only turned into
+    `Participant` objects the first time they are accessed. If that data turns out to be malformed, the error is logged
+    and `participants` is an empty list / `myData` is None instead.
     """
+    # participants/myData stay properties (backed by _participants/_myData) as they are built lazily
+    __slots__ = (
+        "id", "created_at", "game_map", "queue_info", "version", "game_length_second", "is_remake",
+        "is_opscore_active", "is_recorded", "record_info", "average_tier_info", "_participants", "teams", "memo",
+        "_myData", "_raw_participants", "_raw_my_data", "_cache"
+    )
+    
     def __init__(self,
                  id: str,
                  created_at: datetime,
@@ -229,153 +183,45 @@ class Game:
                  is_recorded: bool,
                  record_info: Any,
                  average_tier_info: Tier,
-                 participants: list[Participant],
+                 participants: list[Participant] | None,
                  teams: list[Team],
                  memo: Any,
-                 myData: Participant) -> None:
-        self._id = id
-        self._created_at = created_at
-        self._game_map = game_map
-        self._queue_info = queue_info
-        self._version = version
-        self._game_length_second = game_length_second
-        self._is_remake = is_remake
-        self._is_opscore_active = is_opscore_active
-        self._is_recorded = is_recorded
-        self._record_info = record_info
-        self._average_tier_info = average_tier_info
+                 myData: Participant | None,
+                 raw_participants: list[dict] | None = None,
+                 raw_my_data: dict | None = None,
+                 cache: dict | None = None) -> None:
+        self.id = id
+        self.created_at = created_at
+        self.game_map = game_map
+        self.queue_info = queue_info
+        self.version = version
+        self.game_length_second = game_length_second
+        self.is_remake = is_remake
+        self.is_opscore_active = is_opscore_active
+        self.is_recorded = is_recorded
+        self.record_info = record_info
+        self.average_tier_info = average_tier_info
         self._participants = participants
-        self._teams = teams
-        self._memo = memo
+        self.teams = teams
+        self.memo = memo
         self._myData = myData
+        self._raw_participants = raw_participants
+        self._raw_my_data = raw_my_data
+        self._cache = cache
         
-    @property
-    def id(self) -> str:
-        """
-        A `str` representing the Internal game id
-        """
-        return self._id
-    
-    @id.setter
-    def id(self, value: str) -> None:
-        self._id = value
-        
-    @property
-    def created_at(self) -> datetime:
-        """
-        A `datetime` object representing the Date & Time of game played
-        """
-        return self._created_at
-    
-    @created_at.setter
-    def created_at(self, value: datetime) -> None:
-        self._created_at = value
-        
-    @property
-    def game_map(self) -> str:
-        """
-        A `str` representing the game map (Summoners Rift, Howling Abyss, etc.)
-        """
-        return self._game_map
-    
-    @game_map.setter
-    def game_map(self, value: str) -> None:
-        self._game_map = value
-        
-    @property
-    def queue_info(self) -> QueueInfo:
-        """
-        A `QueueInfo` object representing queue information
-        """
-        return self._queue_info
-    
-    @queue_info.setter
-    def queue_info(self, value: QueueInfo) -> None:
-        self._queue_info = value
-        
-    @property
-    def version(self) -> str:
-        """
-        A `str` representing the game version
-        """
-        return self._version
-    
-    @version.setter
-    def version(self, value: str) -> None:
-        self._version = value
-        
-    @property
-    def game_length_second(self) -> int:
-        """
-        An `int` representing the length of the game in seconds
-        """
-        return self._game_length_second
-     
-    @game_length_second.setter
-    def game_length_second(self, value: int) -> None:
-        self._game_length_second = value
-        
-    @property
-    def is_remake(self) -> bool:
-        """
-        A `bool` representing whether the game was a remake
-        """
-        return self._is_remake
-    
-    @is_remake.setter
-    def is_remake(self, value: bool) -> None:
-        self._is_remake = value
-        
-    @property
-    def is_opscore_active(self) -> bool:
-        """
-        A `bool` representing whether the opscore was active
-        """
-        return self._is_opscore_active
-    
-    @is_opscore_active.setter
-    def is_opscore_active(self, value: bool) -> None:
-        self._is_opscore_active = value
-        
-        
-    @property
-    def is_recorded(self) -> bool:
-        """
-        A `bool` representing whether the game was recorded
-        """
-        return self._is_recorded
-    
-    @is_recorded.setter
-    def is_recorded(self, value: bool) -> None:
-        self._is_recorded = value
-        
-    @property
-    def record_info(self) -> Any:
-        """
-        An `Any` object with unknown return value and type
-        """
-        return self._record_info
-    
-    @record_info.setter
-    def record_info(self, value: Any) -> None:
-        self._record_info = value
-        
-    @property
-    def average_tier_info(self) -> Tier:
-        """
-        A `Tier` object representing the average league tier
-        """
-        return self._average_tier_info
-    
-    @average_tier_info.setter
-    def average_tier_info(self, value: Tier) -> None:
-        self._average_tier_info = value
-         
     @property
     def participants(self) -> list[Participant]:
         """
         A `list[Participant]` object(s) representing all participants of a game
         """
+        if self._participants is None and self._raw_participants is not None:
+            try:
+                self._participants = [_build_participant(participant, self._cache) for participant in self._raw_participants]
+            except (KeyError, TypeError, AttributeError) as e:
+                # used to skip the whole game when it was built, now surfaces on first access (e.g. from repr())
+                _logger.warning("Malformed participants in game %s, leaving them empty: %r", self.id, e)
+                self._participants = []
+            self._raw_participants = None
         return self._participants
     
     @participants.setter
@@ -383,32 +229,16 @@ class Game:
         self._participants = value
     
     @property
-    def teams(self) -> list[Team]:
-        """
-        A `list[Team]` object(s) representing all teams of a game
-        """
-        return self._teams
-    
-    @teams.setter
-    def teams(self, value: list[Team]) -> None:
-        self._teams = value
-        
-    @property
-    def memo(self) -> Any:
+    def myData(self) -> Participant | None:
         """
-        An `Any` object with unknown return value and type
-        """
-        return self._memo
-    
-    @memo.setter
-    def memo(self, value: Any) -> None:
-        self._memo = value
-        
-    @property
-    def myData(self) -> Participant:
-        """
-        A `Participant` object representing personal participant record
+        A `Participant` object representing personal participant record (None if it couldn't be built)
         """
+        if self._myData is None and self._raw_my_data is not None:
+            try:
+                self._myData = _build_participant(self._raw_my_data, self._cache)
+            except (KeyError, TypeError, AttributeError) as e:
+                _logger.warning("Malformed myData in game %s, leaving it unset: %r", self.id, e)
+            self._raw_my_data = None
         return self._myData
     
     @myData.setter
@@ -416,6 +246,8 @@ class Game:
         self._myData = value
     
     def __repr__(self) -> str:
+        if self.myData is None:
+            return f"Game(id={self.id})"
         return f"Game(champion_id={self.myData.champion_id}, kill={self.myData.stats.kill}, death={self.myData.stats.death}, assist={self.myData.stats.assist}, position={self.myData.position}, result={self.myData.stats.result})"
 
 
@@ -440,7 +272,19 @@ class Summoner:
         `league_stats: LeagueStats | list[LeagueStats]` - League stats\n
         `most_champions: list[ChampionStats]` - Most champions\n
         `recent_game_stats: Game | list[Game]` - Recent game stats\n
+    
+    Note: `previous_seasons`, `league_stats` and `most_champions` can be passed as `loaders` (zero argument callables),
+    in which case they are only parsed the first time they are accessed.\n
+    Note: The repr is computed once and cached. If you modify the summoner after printing it, call `refresh_repr()`.\n
+    Note: Summoners compare and hash by `puuid` (by identity when it is None). Don't reassign `puuid` while the summoner
+    is in a set or used as a dict key.
     """
+    __slots__ = (
+        "id", "summoner_id", "acct_id", "puuid", "game_name", "tagline", "name", "internal_name",
+        "profile_image_url", "level", "updated_at", "renewable_at", "_previous_seasons", "_league_stats",
+        "_most_champions", "recent_game_stats", "_loaders", "_tier_by_queue", "_repr_cache"
+    )
+    
     def __init__(self,
                  id: int,
                  summoner_id: str,
@@ -457,200 +301,89 @@ class Summoner:
                  previous_seasons: Season | list[Season] = None,
                  league_stats: LeagueStats | list[LeagueStats] = None,
                  most_champions: list[ChampionStats] = None, 
-                 recent_game_stats: Game | list[Game] = None) -> None:
-        self._id = id
-        self._summoner_id = summoner_id
-        self._acct_id = acct_id
-        self._puuid = puuid
-        self._game_name = game_name
-        self._tagline = tagline
-        self._name = name
-        self._internal_name = internal_name
-        self._profile_image_url = profile_image_url
-        self._level = level
-        self._updated_at = updated_at
-        self._renewable_at = renewable_at
+                 recent_game_stats: Game | list[Game] = None,
+                 loaders: dict[str, Callable[[], list]] | None = None) -> None:
+        self.id = id
+        self.summoner_id = summoner_id
+        self.acct_id = acct_id
+        self.puuid = puuid
+        self.game_name = game_name
+        self.tagline = tagline
+        self.name = name
+        self.internal_name = internal_name
+        self.profile_image_url = profile_image_url
+        self.level = level
+        self.updated_at = updated_at
+        self.renewable_at = renewable_at
         self._previous_seasons = previous_seasons
         self._league_stats = league_stats
         self._most_champions = most_champions  
-        self._recent_game_stats = recent_game_stats
-        
-    @property
-    def id(self) -> int:
-        """
-        An `int` representing the id (opgg specific)
-        """
-        return self._id
-    
-    @id.setter
-    def id(self, value: int) -> None:
-        self._id = value
-        
-    @property
-    def summoner_id(self) -> str:
-        """
-        A `str` representing the summoner id (riot api)
-        """
-        return self._summoner_id
-    
-    @summoner_id.setter
-    def summoner_id(self, value: str) -> None:
-        self._summoner_id = value
-        
-    @property
-    def acct_id(self) -> str:
-        """
-        A `str` representing the account id (riot api)
-        """
-        return self._acct_id
-    
-    @acct_id.setter
-    def acct_id(self, value: str) -> None:
-        self._acct_id = value
-        
-    @property
-    def puuid(self) -> str:
-        """
-        A `str` representing the puuid (riot api)
-        """
-        return self._puuid
+        self.recent_game_stats = recent_game_stats
+        self._loaders = loaders
+        self._tier_by_queue = None
+        self._repr_cache = None
     
-    @puuid.setter
-    def puuid(self, value: str) -> None:
-        self._puuid = value
-    
-    @property
-    def game_name(self) -> str:
+    def _load(self, name: str) -> list | None:
         """
-        A `str` representing the in-game username
+        Run (and drop) the pending loader of a lazy collection, if any.
         """
-        return self._game_name
+        loader = self._loaders.pop(name, None) if self._loaders else None
+        return loader() if loader is not None else None
     
-    @game_name.setter
-    def game_name(self, value: str) -> None:
-        self._game_name = value
+    def _load_cancel(self, name: str) -> None:
+        # an explicitly assigned value replaces whatever the pending loader would have produced
+        if self._loaders:
+            self._loaders.pop(name, None)
     
-    @property
-    def tagline(self) -> str:
-        """
-        A `str` representing the tagline
-        """
-        return self._tagline
-    
-    @tagline.setter
-    def tagline(self, value: str) -> None:
-        self._tagline = value
-    
-    @property
-    def name(self) -> str:
-        """
-        A `str` representing the summoner name
-        """
-        return self._name
-    
-    @name.setter
-    def name(self, value: str) -> None:
-        self._name = value
-        
-    @property
-    def internal_name(self) -> str:
-        """
-        A `str` representing the internal name
-        """
-        return self._internal_name
-    
-    @internal_name.setter
-    def internal_name(self, value: str) -> None:
-        self._internal_name = value
-        
-    @property
-    def profile_image_url(self) -> str:
-        """
-        A `str` representing the profile image url
-        """
-        return self._profile_image_url
-    
-    @profile_image_url.setter
-    def profile_image_url(self, value: str) -> None:
-        self._profile_image_url = value
-        
-    @property
-    def level(self) -> int:
-        """
-        An `int` representing the summoner level
-        """
-        return self._level
-    
-    @level.setter
-    def level(self, value: int) -> None:
-        self._level = value
-        
-    @property
-    def updated_at(self) -> datetime:
-        """
-        A `datetime` object representing when the summoner was last updated
-        """
-        return self._updated_at
-    
-    @updated_at.setter
-    def updated_at(self, value: datetime) -> None:
-        self._updated_at = value
-        
-    @property
-    def renewable_at(self) -> datetime:
-        """
-        A `datetime` object representing when the summoner can be renewed
-        """
-        return self._renewable_at
-    
-    @renewable_at.setter
-    def renewable_at(self, value: datetime) -> None:
-        self._renewable_at = value
-        
     @property
     def previous_seasons(self) -> Season | list[Season]:
         """
-        A `Season | list[Season]` object(s) representing the previously played seasons
+        A `list[Season]` objects representing the summoners previous seasons
         """
+        if self._previous_seasons is None and self._loaders:
+            self._previous_seasons = self._load("previous_seasons")
         return self._previous_seasons
-      
+    
     @previous_seasons.setter
     def previous_seasons(self, value: Season | list[Season]) -> None:
+        self._load_cancel("previous_seasons")
         self._previous_seasons = value
-        
+        # the seasons are part of the cached repr
+        self._repr_cache = None
+    
     @property
     def league_stats(self) -> LeagueStats | list[LeagueStats]:
         """
-        A `LeagueStats | list[LeagueStats]` object(s) representing all applicable league stats
+        A `list[LeagueStats]` objects representing the summoners ranked queues
         """
+        if self._league_stats is None and self._loaders:
+            self._league_stats = self._load("league_stats")
         return self._league_stats
     
     @league_stats.setter
     def league_stats(self, value: LeagueStats | list[LeagueStats]) -> None:
+        self._load_cancel("league_stats")
         self._league_stats = value
-        
+        # reassigning the league stats invalidates the queue -> tier index (and the cached repr)
+        self._tier_by_queue = None
+        self._repr_cache = None
+    
     @property
     def most_champions(self) -> list[ChampionStats]:
         """
-        A `list[ChampionStats]` objects representing the most played champions
+        A `list[ChampionStats]` objects representing the summoners most played champions
         """
+        if self._most_champions is None and self._loaders:
+            self._most_champions = self._load("most_champions")
         return self._most_champions
     
     @most_champions.setter
     def most_champions(self, value: list[ChampionStats]) -> None:
+        self._load_cancel("most_champions")
         self._most_champions = value
-        
-    @property
-    def recent_game_stats(self) -> Game | list[Game]:
-        """
-        A `Game | list[Game]` object(s) representing the most recent games
-        """
-        return self._recent_game_stats
+        # the most played champions are part of the cached repr
+        self._repr_cache = None
     
-    @recent_game_stats.setter
-    def recent_game_stats(self, value: Game | list[Game]) -> None:
-        self._recent_game_stats = value
-
     def get_tier_from_queue(self, queue: Queue = Queue.SOLO) -> Tier:
         """
         A method to get the summoners current tier in a given queue type.
@@ -661,41 +394,90 @@ class Summoner:
         
         ### Returns:
             `Tier` : The tier object which contains the rank, division, and lp.
+        
+        Note: The queue -> tier index is built on first call and reused until `league_stats` is reassigned.
         """
+        if self._tier_by_queue is None:
+            self._tier_by_queue = {}
+            
+            league_stat: LeagueStats
+            for league_stat in self.league_stats or ():
+                # first entry for a queue wins, same as the previous linear scan
+                self._tier_by_queue.setdefault(league_stat.queue_info.game_type, league_stat.tier_info)
         
-        league_stat: LeagueStats
-        for league_stat in self.league_stats:
-            if league_stat.queue_info.game_type == queue:
-                return league_stat.tier_info
-        else:
-            return None
+        return self._tier_by_queue.get(queue)
+    
+    def __eq__(self, other: object) -> bool:
+        # a summoner is identified by its puuid, so results of separate searches compare (and hash) equal.
+        # without one (e.g. a partially filled summoner) there's nothing to identify it by, fall back to identity
+        if not isinstance(other, Summoner):
+            return NotImplemented
+        if self.puuid is None or other.puuid is None:
+            return self is other
+        return self.puuid == other.puuid
+    
+    def __hash__(self) -> int:
+        return hash(self.puuid) if self.puuid is not None else object.__hash__(self)
+    
+    def refresh_repr(self) -> None:
+        """
+        Drop the cached repr, so the next `repr()` reflects changes made to the summoner.
+        """
+        self._repr_cache = None
     
     def get_top_champ(self) -> ChampionStats:
         return self.most_champions[0]
         
     
     def __repr__(self) -> str:
-        previous_seasons_fmt, league_stats_fmt, champion_stats_fmt, game_fmt = "", "", "", ""
+        # a summoner isn't changed after it's built, so the (long) repr is computed once and reused
+        # (the collection setters drop it, other changes need refresh_repr())
+        if self._repr_cache is not None:
+            return self._repr_cache
+        
+        rows = [_REPR_TEMPLATE.format(*_row_getter(self))]
         
-        for season in self.previous_seasons: previous_seasons_fmt += f"{''.ljust(LJF+RJF)}  | {season}\n"
-        for league_stat in self.league_stats: league_stats_fmt += f"{''.ljust(LJF+RJF)}  | {league_stat}\n"
-        for champ_stat in self.most_champions: champion_stats_fmt += f"{''.ljust(LJF+RJF)}  | {champ_stat}\n"
-        for game in self.recent_game_stats: game_fmt += f"{''.ljust(LJF+RJF)}  | {game}\n"
+        for prefix, attr in _LIST_ROWS:
+            items = getattr(self, attr)
+            rows.append(f"{prefix}[List ({len(items)})] \n")
+            rows.extend([f"{PAD}  | {item}\n" for item in items])
         
-        return  f"[Summoner: {self.game_name}]\n{'-' * 80}\n" \
-                f"{'Id'.ljust(LJF)} {'(int)'.rjust(RJF)} | {self.id}\n" \
-                f"{'Summoner Id'.ljust(LJF)} {'(str)'.rjust(RJF)} | {self.summoner_id}\n" \
-                f"{'Account Id'.ljust(LJF)} {'(str)'.rjust(RJF)} | {self.acct_id}\n" \
-                f"{'Puuid'.ljust(LJF)} {'(str)'.rjust(RJF)} | {self.puuid}\n" \
-                f"{'Game Name'.ljust(LJF)} {'(str)'.rjust(RJF)} | {self.game_name}\n" \
-                f"{'Tagline'.ljust(LJF)} {'(str)'.rjust(RJF)} | {self.tagline}\n" \
-                f"{'Name'.ljust(LJF)} {'(str)'.rjust(RJF)} | {self.name}\n" \
-                f"{'Internal Name'.ljust(LJF)} {'(str)'.rjust(RJF)} | {self.internal_name}\n" \
-                f"{'Profile Image Url'.ljust(LJF)} {'(str)'.rjust(RJF)} | {self.profile_image_url}\n" \
-                f"{'Level'.ljust(LJF)} {'(int)'.rjust(RJF)} | {self.level}\n" \
-                f"{'Updated At'.ljust(LJF)} {'(datetime)'.rjust(RJF)} | {self.updated_at}\n" \
-                f"{'Renewable At'.ljust(LJF)} {'(datetime)'.rjust(RJF)} | {self.renewable_at}\n" \
-                f"{'Previous Seasons'.ljust(LJF)} {'(Season)'.rjust(RJF)} | [List ({len(self.previous_seasons)})] \n{previous_seasons_fmt}" \
-                f"{'League Stats'.ljust(LJF)} {'(LeagueStats)'.rjust(RJF)} | [List ({len(self.league_stats)})] \n{league_stats_fmt}" \
-                f"{'Most Champions'.ljust(LJF)} {'(ChampStats)'.rjust(RJF)} | [List ({len(self.most_champions)})] \n{champion_stats_fmt}" \
-                f"{'Recent Game Stats'.ljust(LJF)} {'(Game)'.rjust(RJF)} | [List ({len(self.recent_game_stats)})] \n{game_fmt}"
\ No newline at end of file
+        self._repr_cache = "".join(rows)
+        return self._repr_cache
+
+
+def _build_participant(participant: dict, cache: dict | None = None, *, 
+                       Participant=Participant, Summoner=Summoner, Stats=Stats, Tier=Tier, _dedup=_dedup, _intern=_intern,
+                       _summoner_getter=_summoner_getter, _stats_getter=_stats_getter, _tier_getter=_tier_getter) -> Participant:
+    """
+    Build a `Participant` object from a raw participant dict of the games endpoint.
+    
+    ### Args:
+        participant : `dict`
+            A single entry of a game's "participants" list (or its "myData").
+        
+        cache : `dict, optional`
+            Per-batch dedup cache shared by the games of one request, so identical `Summoner`/`Tier` objects are only built once.
+    
+    ### Returns:
+        `Participant` : A Participant object representing the player in that game.
+    """
+    p_rune = participant["rune"]
+    return Participant(
+        summoner=_dedup(cache, Summoner, _summoner_getter(participant["summoner"])),
+        participant_id=participant["participant_id"],
+        champion_id=participant["champion_id"],
+        team_key=_intern(participant["team_key"]),
+        position=_intern(participant["position"]),
+        role=_intern(participant["role"]),
+        items=tuple(participant["items"]),
+        trinket_item=participant["trinket_item"],
+        rune=(
+            p_rune["primary_page_id"],
+            p_rune["primary_rune_id"],
+            p_rune["secondary_page_id"]
+        ), # temp, eventually turn this into an object..?
+        spells=tuple(participant["spells"]),
+        stats=Stats(*_stats_getter(participant["stats"])),
+        tier_info=_dedup(cache, Tier, _tier_getter(participant["tier_info"]))
+    )
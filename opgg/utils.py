@@ -4,18 +4,101 @@
 # Date    : 2024-07-10
 # License : BSD-3-Clause
 
-from datetime import datetime
-import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import wraps
+from typing import Iterator
+import inspect
+import logging
+import orjson
+import random
+import re
 import requests
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+import threading
+import time
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 
 from opgg.cacher import Cacher
-from opgg.champion import Champion, Passive, Price, Skin, Spell
+from opgg.champion import Champion
 from opgg.params import By, Region
 from opgg.season import SeasonInfo
 
 
+# A handful of current desktop browser user agents, one is picked per process. (Replaces fake_useragent, which
+# loads and parses its whole UA database just to hand out a single string)
+_UA_POOL = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36 Edg/126.0.0.0",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:127.0) Gecko/20100101 Firefox/127.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15",
+)
+
+# Slices the page props JSON straight out of the raw html, no parse tree needed
+_NEXT_DATA_RE = re.compile(rb'<script[^>]*\bid="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+_NEXT_DATA_STRAINER = SoupStrainer("script", id="__NEXT_DATA__")
+# what get_page_props' stream loop looks for, the attribute rather than the bare name (inline scripts mention that too)
+_NEXT_DATA_ANCHOR = b'id="__NEXT_DATA__"'
+
+
+def _ttl_cache(func):
+    """
+    Memoize a `Utils` fetcher per its arguments for `Utils.cache_ttl` seconds. (Thread-safe)
+    
+    At most `Utils.cache_maxsize` results are kept, expired ones are evicted on every insert and the least recently
+    used one once the cache is full. Callers get a shallow copy of a cached `list`/`dict`, so changing it can't
+    corrupt what everyone else sees. (The objects inside are still shared, `.shared()` skips the copy for read-only use)
+    
+    Calls that pass their own `page_props` are never cached, the result depends on data the caller already holds.
+    """
+    signature = inspect.signature(func)
+    cache: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+    lock = threading.Lock()
+    
+    @wraps(func)
+    def shared(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        
+        if bound.arguments.get("page_props") is not None:
+            return func(*args, **kwargs)
+        
+        key = tuple(tuple(value) if isinstance(value, list) else value for value in bound.arguments.values())
+        now = time.monotonic()
+        
+        with lock:
+            hit = cache.get(key)
+            if hit is not None and hit[0] > now:
+                cache.move_to_end(key)
+                return hit[1]
+        
+        result = func(*args, **kwargs)
+        
+        with lock:
+            for expired in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+                del cache[expired]
+            
+            cache[key] = (now + Utils.cache_ttl, result)
+            cache.move_to_end(key)
+            
+            while len(cache) > Utils.cache_maxsize:
+                cache.popitem(last=False)
+        
+        return result
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        result = shared(*args, **kwargs)
+        return result.copy() if isinstance(result, (list, dict)) else result
+    
+    wrapper.shared = shared
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
 class Utils:
     """
     ### utils.py
@@ -26,27 +109,149 @@ class Utils:
     """
     
     _base_api_url = "https://lol-web-api.op.gg/api/v1.0/internal/bypass"
-    _api_url = f"{_base_api_url}/summoners/{{region}}/{{summoner_id}}/renewal"
+    # bound once, called positionally as _build_api_url(region, summoner_id)
+    _build_api_url = f"{_base_api_url}/summoners/{{}}/{{}}/renewal".format
+    # called as _build_multisearch_url(region), the summoner names are sent as a query param (see get_page_props)
+    _build_multisearch_url = "https://www.op.gg/multisearch/{}".format
     
-    ua = UserAgent()
     headers = { 
-        "User-Agent": ua.random
+        "User-Agent": random.choice(_UA_POOL)
     }
     
+    # Shared by every request the library sends (all OPGG instances, all threads), so concurrent searches
+    # can't flood op.gg. Rate limited (429) / failing (5xx) responses are retried with a backoff.
+    _max_concurrent_requests = 8
+    max_retries = 3
+    
+    # Seconds that champions and seasons are reused for before being fetched again (see _ttl_cache)
+    cache_ttl = 3600
+    # Results kept per fetcher, least recently used ones are dropped past this (see _ttl_cache)
+    cache_maxsize = 32
+    
+    # (kind, attribute) -> (indexed list, {attribute value: item}), see _index()
+    _indices: dict[tuple[str, str], tuple[list, dict]] = {}
+    _request_slots = threading.BoundedSemaphore(_max_concurrent_requests)
+    
+    # One pooled session for the whole library, so repeat calls reuse keep-alive connections instead of
+    # paying a fresh TCP + TLS handshake each time. The pool is sized to the concurrency limit above.
+    # (Retries stay in request() so they honor Retry-After and release the slot while backing off)
+    _session = requests.Session()
+    _session.headers.update(headers)
+    _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=_max_concurrent_requests))
+    
+    # Worker threads for the request fan-outs (search, update), started once and kept for the life of the process 
+    # like the session above, instead of spawning a new pool per call. (See _get_executor)
+    _executor: ThreadPoolExecutor | None = None
+    _executor_lock = threading.Lock()
+    
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        """
+        The shared fan-out pool, created on first use. 
+        
+        Sized to the request limit, more workers would only queue on `_request_slots`. Tasks run on it must not 
+        wait on other tasks of the pool.
+        
+        ### Returns:
+            `ThreadPoolExecutor` : The process wide executor.
+        """
+        if Utils._executor is None:
+            with Utils._executor_lock:
+                if Utils._executor is None:
+                    Utils._executor = ThreadPoolExecutor(
+                        max_workers=Utils._max_concurrent_requests, thread_name_prefix="OPGG.py"
+                    )
+        
+        return Utils._executor
+    
+    
+    @staticmethod
+    def set_session(session: requests.Session) -> None:
+        """
+        Swap the session every request is sent through. (All OPGG instances, all threads)
+        
+        Any `requests.Session` compatible object works, e.g. a `requests_cache.CachedSession` to cache 
+        champion/season lookups at the http layer.
+        
+        ### Args:
+            session : `requests.Session`
+                The session to use from now on. The default OPGG headers are added to it.
+        """
+        session.headers.update(Utils.headers)
+        Utils._session = session
+    
+    
+    @staticmethod
+    def request(method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send an HTTP request to OPGG, bounded by the shared concurrency limit and retried on 429/5xx responses.
+        
+        ### Args:
+            method : `str`
+                HTTP method ("GET", "POST", etc.)
+            
+            url : `str`
+                The url to send the request to.
+            
+            **kwargs : `any`
+                Passed through to `requests.Session.request` (headers, params, etc.)
+        
+        ### Returns:
+            `requests.Response` : The final response. (Still 429/5xx if all retries were used up)
+        """
+        for attempt in range(Utils.max_retries + 1):
+            with Utils._request_slots:
+                res = Utils._session.request(method, url, **kwargs)
+            
+            if (res.status_code != 429 and res.status_code < 500) or attempt == Utils.max_retries:
+                return res
+            
+            # release the connection of the discarded response (matters for stream=True requests)
+            res.close()
+            
+            # sleep outside of the semaphore so a backing off request doesn't hold a slot
+            delay = Utils._retry_delay(res, attempt)
+            logging.getLogger("OPGG.py").warning(
+                "%s %s returned %s, retrying in %.1fs (attempt %s/%s)...", 
+                method, url, res.status_code, delay, attempt + 1, Utils.max_retries
+            )
+            time.sleep(delay)
+    
+    
+    @staticmethod
+    def _retry_delay(res: requests.Response, attempt: int) -> float:
+        """
+        Seconds to wait before retrying, honoring the `Retry-After` header (seconds or http-date) when present,
+        otherwise an exponential backoff (0.5s, 1s, 2s, ...). Capped at 30 seconds.
+        """
+        retry_after = res.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0), 30)
+            except ValueError:
+                try:
+                    return min(max((parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds(), 0), 30)
+                except (TypeError, ValueError):
+                    pass
+        
+        return min(0.5 * 2 ** attempt, 30)
+    
+    
     @staticmethod
-    def update(summoner_id: str, region: Region = Region.NA) -> dict:
+    def update(summoner_id: str | list[str], region: Region = Region.NA) -> dict | list[dict]:
         """
         Send an update request to fetch the latest details for a given summoner (id).
         
         ### Parameters
-            summoner_id : `str`
-                Pass a summoner id as a string to be updated
+            summoner_id : `str | list[str]`
+                Pass a summoner id as a string to be updated, or a list of them.\n
+                Note: A list is sent concurrently (within the shared request limit) and returns a list of responses, in the same order.
             
             region : `Region, optional`
                 Pass the region you want to perform the update in. Default is "NA".
 
         ### Returns
-            `dict` : Returns a dictionary with the status response.
+            `dict | list[dict]` : Returns a dictionary with the status response. (A list of them if a list was passed)
                 Example response:
             ```
             {
@@ -59,14 +264,21 @@ class Utils:
             }
             ```
         """
+        if isinstance(summoner_id, list):
+            if not summoner_id:
+                return []
+            
+            # renewals are independent round trips, so fan them out instead of waiting on each in turn
+            return list(Utils._get_executor().map(lambda _summoner_id: Utils.update(_summoner_id, region), summoner_id))
         
-        res = requests.post(
-            Utils._api_url.format(region=region, summoner_id=summoner_id), 
+        res = Utils.request(
+            "POST",
+            Utils._build_api_url(region, summoner_id),
             headers=Utils.headers
         )
         
         if res.status_code in [201, 202]:
-            return res.json()
+            return orjson.loads(res.content)
         else:
             res.raise_for_status()
     
@@ -86,20 +298,55 @@ class Utils:
 
         ### Returns
             `dict` : Returns a dictionary with the page props.
+        
+        Note: Not memoized (unlike champions/seasons), it reflects the summoners' current state, e.g. right after `update()`.
         """
         
-        if isinstance(summoner_names, list) and len(summoner_names) > 0: 
+        if isinstance(summoner_names, list): 
             summoner_names = ",".join(summoner_names)
         
-        url = f"https://www.op.gg/multisearch/{region}?summoners={summoner_names}"
-
-        res = requests.get(url, headers=Utils.headers, allow_redirects=True)
-        soup = BeautifulSoup(res.content, "html.parser")
+        # the names go through params= so requests percent-encodes them, a raw "#" (Riot ID tagline) would otherwise
+        # start the url fragment and cut everything after it out of the request
+        res = Utils.request(
+            "GET", 
+            Utils._build_multisearch_url(region), 
+            params={"summoners": summoner_names}, 
+            headers=Utils.headers, 
+            allow_redirects=True, 
+            stream=True
+        )
+        
+        # Only read as far as the end of the __NEXT_DATA__ script, the rest of the page is never needed
+        body = bytearray()
+        start = -1
+        with res:
+            for chunk in res.iter_content(chunk_size=64 * 1024):
+                # re-check the tail of the previous chunk too, in case the anchor was split across the boundary
+                scan_from = max(len(body) - len(_NEXT_DATA_ANCHOR), 0)
+                body += chunk
+                
+                if start == -1:
+                    start = body.find(_NEXT_DATA_ANCHOR, scan_from)
+                
+                if start != -1 and body.find(b"</script>", max(start, scan_from)) != -1:
+                    break
+        
+        match = _NEXT_DATA_RE.search(body)
+        if match:
+            return orjson.loads(match.group(1))['props']['pageProps']
+        
+        # markup didn't look as expected, fall back to parsing the html (only the __NEXT_DATA__ script is kept in the tree)
+        soup = BeautifulSoup(bytes(body), "html.parser", parse_only=_NEXT_DATA_STRAINER)
+        next_data = soup.select_one("#__NEXT_DATA__")
+        
+        if next_data is None:
+            raise Exception(f"No __NEXT_DATA__ script was found in the OPGG multisearch page for: \"{summoner_names}\" (HTTP {res.status_code})")
         
-        return json.loads(soup.select_one("#__NEXT_DATA__").text)['props']['pageProps']
+        return orjson.loads(next_data.text)['props']['pageProps']
     
     
     @staticmethod
+    @_ttl_cache
     def get_all_seasons(region = Region.NA, page_props = None) -> list[SeasonInfo]:
         """
         Get all seasons from OPGG.
@@ -116,7 +363,9 @@ class Utils:
             `list[SeasonInfo]` : A list of SeasonInfo objects.
         """
         # Check cache, if found, return it, otherwise continue to below logic.
-        cached_seasons = Cacher().get_all_seasons()
+        # (the shared cacher keeps its connection open, instead of opening and configuring one per call)
+        cached_seasons = Cacher.shared().get_all_seasons()
+        
         if cached_seasons:
             return cached_seasons
         
@@ -149,24 +398,25 @@ class Utils:
                 Pass a By enum to specify how you want to get the season(s).
             
             value : `int | str | list`
-                Pass the value(s) you want to search by. (id, display_value, etc.)
+                Pass the value(s) you want to search by. (id, display_value, etc.)\n
+                Note: For a list, each matching season is returned once, in season list order.
         
         ### Returns:
             `SeasonInfo | list[SeasonInfo]` : A single or list of SeasonInfo objects.
         """
-        all_seasons = Utils.get_all_seasons()
+        # the cached list itself (read-only here), so the index below is reused until it expires
+        all_seasons = Utils.get_all_seasons.shared()
         result_set = []
         
         if by == By.ID:
             if isinstance(value, list):
-                for season in all_seasons:
-                    for id in value:
-                        if season.id == id:
-                            result_set.append(season)
+                # each matching season once, in season list order (duplicate ids don't repeat it)
+                ids = dict.fromkeys(value)
+                result_set = [season for season in all_seasons if season.id in ids]
             else:
-                for season in all_seasons:
-                    if season.id == int(value):
-                        result_set.append(season)
+                seasons_by_id = Utils._index("season", all_seasons, "id")
+                if int(value) in seasons_by_id:
+                    result_set.append(seasons_by_id[int(value)])
         
         # TODO: perhaps add more ways to get season objs, like by is_preseason, or display_name, etc.           
         
@@ -174,6 +424,37 @@ class Utils:
     
     
     @staticmethod
+    def _index(kind: str, items: list, attr: str) -> dict:
+        """
+        Map each item's `attr` value to the item, so lookups by id/key/name are a dict hit instead of a list scan.
+        
+        The index is kept per `(kind, attr)` and reused for as long as the same list is passed in.
+        (`get_all_champions.shared()` / `get_all_seasons.shared()` hand out the same list until their cache expires)
+        
+        ### Args:
+            kind : `str`
+                Label for what is being indexed. ("champion", "season", etc.)
+            
+            items : `list`
+                The objects to index.
+            
+            attr : `str`
+                Attribute to index by.
+        
+        ### Returns:
+            `dict` : A `dict` of `{getattr(item, attr): item}`.
+        """
+        cached = Utils._indices.get((kind, attr))
+        if cached is not None and cached[0] is items:
+            return cached[1]
+        
+        index = {getattr(item, attr): item for item in items}
+        Utils._indices[(kind, attr)] = (items, index)
+        return index
+    
+    
+    @staticmethod
+    @_ttl_cache
     def get_all_champions(region = Region.NA, page_props = None) -> list[Champion]:
         """
         Get all champion info from OPGG.
@@ -189,81 +470,42 @@ class Utils:
         Returns:
             `list[Champion]` : A list of Champion objects.
         """
-        # Check cache, if found, return it, otherwise continue to below logic.        
-        champions = []
+        return list(Utils.iter_all_champions(region, page_props))
+    
+    
+    @staticmethod
+    def iter_all_champions(region = Region.NA, page_props = None) -> Iterator[Champion]:
+        """
+        Lazily build champions from OPGG, one at a time. (Same sources as `get_all_champions`, without the memoization)
         
+        Useful when only the first match is needed, the remaining champions are never built.
+
+        ### Args:
+            region : `Region, optional`
+                Pass the region you want to search in. Defaults to "NA".
+                
+            page_props : `dict, optional`
+                Pass the page props if the program has queried them once before.
+
+        ### Returns:
+            `Iterator[Champion]` : A generator of Champion objects.
+        """
+        # Check cache, if found, return it, otherwise continue to below logic.
         if not page_props:
-            cached_champions = Cacher().get_all_champs()
+            cached_champions = Cacher.shared().get_all_champs()
+            
             if cached_champions: 
-                return cached_champions
+                yield from cached_champions
+                return
             
-            res = requests.get(f"{Utils._base_api_url}/meta/champions?hl=en_US", headers=Utils.headers)
-            raw_champs_data = json.loads(res.text)["data"]
+            res = Utils.request("GET", f"{Utils._base_api_url}/meta/champions?hl=en_US", headers=Utils.headers)
+            raw_champs_data = orjson.loads(res.content)["data"]
             
         else:
             raw_champs_data = dict(page_props['championsById']).values()
         
         for champion in raw_champs_data:
-            # reset per iteration
-            _spells = []
-            _skins = []
-            
-            for skin in champion["skins"]:
-                _prices = []
-                
-                if skin["prices"]:
-                    for price in skin["prices"]:
-                        _prices.append(Price(
-                            currency = price["currency"] if "RP" in price["currency"] else "BE",
-                            cost = price["cost"]
-                        ))
-                else:
-                    _prices = None
-                
-                _skins.append(Skin(
-                    id = skin["id"],
-                    champion_id = skin["champion_id"],
-                    name = skin["name"],
-                    centered_image = skin["centered_image"],
-                    skin_video_url = skin["skin_video_url"],
-                    prices = _prices,
-                    release_date = datetime.fromisoformat(skin["release_date"]) if skin["release_date"] else None,
-                    sales = skin["sales"]
-                ))
-                    
-            for spell in champion["spells"]:
-                _spells.append(Spell(
-                    key = spell["key"],
-                    name = spell["name"],
-                    description = spell["description"],
-                    max_rank = spell["max_rank"],
-                    range_burn = spell["range_burn"],
-                    cooldown_burn = spell["cooldown_burn"],
-                    cooldown_burn_float = spell["cooldown_burn_float"],
-                    cost_burn = spell["cost_burn"],
-                    tooltip = spell["tooltip"],
-                    image_url = spell["image_url"],
-                    video_url = spell["video_url"]
-                ))       
-              
-            champions.append(Champion(
-                id = champion["id"],
-                key = champion["key"],
-                name = champion["name"],
-                image_url = champion["image_url"],
-                evolve = champion["evolve"],
-                partype = champion["partype"],
-                passive = Passive(
-                    name = champion["passive"]["name"],
-                    description = champion["passive"]["description"],
-                    image_url = champion["passive"]["image_url"],
-                    video_url = champion["passive"]["video_url"]
-                ),
-                spells = _spells,
-                skins = _skins
-            ))            
-        
-        return champions
+            yield Champion.from_dict(champion)
     
     
     @staticmethod
@@ -276,7 +518,8 @@ class Utils:
                 Pass a By enum to specify how you want to get the champion(s).
                 
             value : `int | str | list`
-                Pass the value(s) you want to search by. (id, key, name, etc.)
+                Pass the value(s) you want to search by. (id, key, name, etc.)\n
+                Note: For a list of ids/keys/names, each matching champion is returned once, in champion list order.
                 
             **kwargs : `any`
                 Pass any additional keyword arguments to narrow down the search.\n
@@ -289,44 +532,31 @@ class Utils:
         # but I might introduce other metrics of getting champ objs later, idk...
         
         if ("page_props" in kwargs):
+            # page props aren't memoized, so for a single id/key/name stop building champions at the first match
+            if by in (By.ID, By.KEY, By.NAME) and not isinstance(value, list):
+                _value = int(value) if by == By.ID else value
+                for champ in Utils.iter_all_champions(page_props=kwargs["page_props"]):
+                    if getattr(champ, str(by)) == _value:
+                        return champ
+            
             all_champs = Utils.get_all_champions(page_props=kwargs["page_props"])
         else:
-            all_champs = Utils.get_all_champions()
+            # the cached list itself (read-only here), so the index below is reused until it expires
+            all_champs = Utils.get_all_champions.shared()
         
         result_set = []
         
-        if by == By.ID:
-            if isinstance(value, list):
-                for champ in all_champs:
-                    for id in value:
-                        if champ.id == id:
-                            result_set.append(champ)
-            else:
-                for champ in all_champs:
-                    if champ.id == int(value):
-                        result_set.append(champ)
-                
-        elif by == By.KEY:
-            if isinstance(value, list):
-                for champ in all_champs:
-                    for key in value:
-                        if champ.key == key:
-                            result_set.append(champ)
-            else:
-                for champ in all_champs:
-                    if champ.key == value:
-                        result_set.append(champ)
-        
-        elif by == By.NAME:
+        if by in (By.ID, By.KEY, By.NAME):
             if isinstance(value, list):
-                for champ in all_champs:
-                    for name in value:
-                        if champ.name == name:
-                            result_set.append(champ)
+                # each matching champion once, in champion list order (duplicate values don't repeat it)
+                values = dict.fromkeys(value)
+                result_set = [champ for champ in all_champs if getattr(champ, str(by)) in values]
             else:
-                for champ in all_champs:
-                    if champ.name == value:
-                        result_set.append(champ)
+                champs_by = Utils._index("champion", all_champs, str(by))
+                # ids are compared as ints, like the season lookup
+                _value = int(value) if by == By.ID else value
+                if _value in champs_by:
+                    result_set.append(champs_by[_value])
         
         elif by == By.COST:
             for champ in all_champs:
@@ -0,0 +1,183 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+# Add module to path to reference opgg subdir from here.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from opgg.cacher import Cacher
+
+
+# The champion/spell tables as created by the original cacher, before spells were keyed by (champion_id, spell_key)
+_BASELINE_SCHEMA_SQL = """
+CREATE TABLE tblSummoners (summoner_name PRIMARY KEY, summoner_id);
+CREATE TABLE tblChampions (
+    champion_id PRIMARY KEY, champion_key, champion_name, champion_image_url, champion_evolve_list, champion_partype
+);
+CREATE TABLE tblSeasonInfo (
+    season_id PRIMARY KEY, season_value, season_display_name, season_split, season_is_preseason
+);
+CREATE TABLE tblPassives (
+    champion_id PRIMARY KEY, passive_name, passive_description, passive_image_url, passive_video_url
+);
+CREATE TABLE tblSpells (
+    champion_id, spell_key, spell_name PRIMARY KEY, spell_description, spell_max_rank, spell_range_burn_list,
+    spell_cooldown_burn_list, spell_cooldown_burn_float_list, spell_cost_burn_list, spell_tooltip, spell_image_url,
+    spell_video_url
+);
+CREATE TABLE tblSkins (
+    champion_id, skin_id PRIMARY KEY, skin_name, skin_centered_image, skin_video_url, skin_prices, skin_sales,
+    skin_release_date
+);
+
+INSERT INTO tblSummoners VALUES ('one#NA1', 'id1');
+INSERT INTO tblSeasonInfo VALUES (11, 11, 2021, 1, 0);
+INSERT INTO tblChampions VALUES (1, 'Annie', 'Annie', 'url', '[]', 'Mana');
+INSERT INTO tblSpells VALUES (1, 'Q', 'Disintegrate', '', 5, '[]', '[]', '[]', '[]', '', '', '');
+"""
+
+
+class CacherTestCase(unittest.TestCase):
+    """
+    Base for the offline cacher tests, every test runs in (and caches to) its own temporary directory.
+    
+    `setup()` looks for old caches under ./cache of the working directory, so the tests change into the temporary 
+    directory too rather than risk touching a real cache.
+    """
+    
+    def setUp(self) -> None:
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.db_path = os.path.join(self._tmp.name, "test.db")
+    
+    def tearDown(self) -> None:
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+
+class BackgroundWriterTests(CacherTestCase):
+    """
+    Tests for `queue_summoners()` / `flush()` / `close()` and the writer thread behind them
+    """
+    
+    def setUp(self) -> None:
+        super().setUp()
+        self.cacher = Cacher(self.db_path)
+        self.cacher.setup()
+    
+    def tearDown(self) -> None:
+        self.cacher.close()
+        super().tearDown()
+    
+    def _flush_returns(self, timeout: float = 5) -> bool:
+        # run flush() on a daemon thread, so a regression hangs only that thread instead of the whole test run
+        flusher = threading.Thread(target=self.cacher.flush, daemon=True)
+        flusher.start()
+        flusher.join(timeout)
+        return not flusher.is_alive()
+    
+    def test_queue_flush_and_read_back(self) -> None:
+        self.cacher.queue_summoners([("one#NA1", "id1"), ("two#NA1", "id2")])
+        self.cacher.queue_summoners([("three#NA1", "id3")])
+        self.assertTrue(self._flush_returns())
+        
+        self.assertEqual(
+            self.cacher.get_summoner_ids(["one#NA1", "two#NA1", "three#NA1", "four#NA1"]),
+            {"one#NA1": "id1", "two#NA1": "id2", "three#NA1": "id3", "four#NA1": None}
+        )
+    
+    def test_close_then_queue_restarts_the_writer(self) -> None:
+        self.cacher.queue_summoners([("one#NA1", "id1")])
+        writer = self.cacher._writer
+        self.cacher.close()
+        
+        # close() drains and stops the writer
+        self.assertFalse(writer.is_alive())
+        self.assertIsNone(self.cacher._writer)
+        
+        self.cacher.queue_summoners([("two#NA1", "id2")])
+        self.assertIsNot(self.cacher._writer, writer)
+        self.assertTrue(self._flush_returns())
+        
+        self.assertEqual(self.cacher.get_summoner_id("one#NA1"), "id1")
+        self.assertEqual(self.cacher.get_summoner_id("two#NA1"), "id2")
+    
+    def test_flush_returns_once_the_writer_is_dead(self) -> None:
+        # a writer that exits without draining its queue, the queued item is never marked done
+        with mock.patch.object(Cacher, "_writer_loop", lambda self: None):
+            self.cacher.queue_summoners([("one#NA1", "id1")])
+            self.cacher._writer.join()
+        
+        self.assertTrue(self._flush_returns())
+    
+    def test_unopenable_database_does_not_hang_flush(self) -> None:
+        cacher = Cacher(os.path.join(self._tmp.name, "missing", "dir", "test.db"))
+        cacher.queue_summoners([("one#NA1", "id1")])
+        
+        flusher = threading.Thread(target=cacher.flush, daemon=True)
+        flusher.start()
+        flusher.join(5)
+        self.assertFalse(flusher.is_alive())
+        cacher.close()
+
+
+class SpellsPrimaryKeyMigrationTests(CacherTestCase):
+    """
+    Tests for the `setup()` migration of caches whose spells are keyed by `spell_name` alone
+    """
+    
+    def setUp(self) -> None:
+        super().setUp()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executescript(_BASELINE_SCHEMA_SQL)
+        conn.close()
+        
+        self.cacher = Cacher(self.db_path)
+    
+    def tearDown(self) -> None:
+        self.cacher.close()
+        super().tearDown()
+    
+    def _spells_pk(self) -> list[str]:
+        columns = self.cacher.connect().execute("PRAGMA table_info(tblSpells);").fetchall()
+        return [column[1] for column in sorted(columns, key=lambda c: c[5]) if column[5]]
+    
+    def _count(self, table: str) -> int:
+        return self.cacher.connect().execute(f"SELECT COUNT(*) FROM {table};").fetchone()[0]
+    
+    def test_champion_tables_are_rebuilt_with_the_new_key(self) -> None:
+        self.assertEqual(self._spells_pk(), ["spell_name"])
+        self.cacher.setup()
+        
+        self.assertEqual(self._spells_pk(), ["champion_id", "spell_key"])
+        # the champion tables start over empty, to be refetched whole
+        for table in ("tblChampions", "tblPassives", "tblSpells", "tblSkins", "tblChampionBlob"):
+            self.assertEqual(self._count(table), 0, table)
+    
+    def test_seasons_and_summoners_survive(self) -> None:
+        self.cacher.setup()
+        
+        self.assertEqual(self.cacher.get_summoner_id("one#NA1"), "id1")
+        self.assertEqual(self._count("tblSeasonInfo"), 1)
+    
+    def test_second_setup_does_nothing(self) -> None:
+        self.cacher.setup()
+        self.cacher.connect().execute(
+            "INSERT INTO tblSpells (champion_id, spell_key, spell_name) VALUES (1, 'Q', 'Disintegrate');"
+        )
+        
+        with mock.patch.object(Cacher, "drop_tables") as drop_tables:
+            self.cacher.setup()
+        
+        drop_tables.assert_not_called()
+        self.assertEqual(self._spells_pk(), ["champion_id", "spell_key"])
+        self.assertEqual(self._count("tblSpells"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
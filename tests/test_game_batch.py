@@ -0,0 +1,85 @@
+import os
+import sys
+import unittest
+
+# Add module to path to reference opgg subdir from here.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from opgg.game import GameBatch
+from opgg.params import Position, TeamKey
+
+
+def _participant(participant_id: int, champion_id: int, team_key: str, position: str | None, 
+                 kill: int, death: int, assist: int, result: str) -> dict:
+    # only the fields GameBatch reads, the rest of the games endpoint payload is ignored
+    return {
+        "participant_id": participant_id,
+        "champion_id": champion_id,
+        "team_key": team_key,
+        "position": position,
+        "stats": {"kill": kill, "death": death, "assist": assist, "result": result},
+    }
+
+
+GAMES = [
+    {"participants": [
+        _participant(1, 10, "BLUE", "TOP", 5, 2, 3, "WIN"),
+        _participant(2, 20, "RED", "MID", 1, 4, 1, "LOSE"),
+    ]},
+    {"participants": [
+        _participant(1, 10, "RED", "JUNGLE", 2, 3, 4, "LOSE"),
+        # ARAM style participant: no position, and a team key the enum doesn't know
+        _participant(2, 30, "PURPLE", None, 7, 0, 9, "WIN"),
+    ]},
+]
+
+
+class GameBatchTests(unittest.TestCase):
+    """
+    Offline tests for `GameBatch.from_games` and its aggregates, built from a small fixed games payload
+    """
+    
+    def setUp(self) -> None:
+        self.batch = GameBatch.from_games(GAMES)
+    
+    def test_one_row_per_participant(self) -> None:
+        self.assertEqual(len(self.batch), 4)
+        self.assertEqual(list(self.batch.game_index), [0, 0, 1, 1])
+        self.assertEqual(list(self.batch.participant_id), [1, 2, 1, 2])
+        self.assertEqual(list(self.batch.champion_id), [10, 20, 10, 30])
+        self.assertEqual(repr(self.batch), "GameBatch(rows=4, games=2)")
+    
+    def test_team_and_position_codes(self) -> None:
+        self.assertEqual(list(self.batch.team), [TeamKey.BLUE, TeamKey.RED, TeamKey.RED, TeamKey.UNKNOWN])
+        self.assertEqual(list(self.batch.position), [Position.TOP, Position.MID, Position.JUNGLE, Position.UNKNOWN])
+    
+    def test_stat_columns(self) -> None:
+        self.assertEqual(list(self.batch.kill), [5, 1, 2, 7])
+        self.assertEqual(list(self.batch.death), [2, 4, 3, 0])
+        self.assertEqual(list(self.batch.assist), [3, 1, 4, 9])
+        self.assertEqual(list(self.batch.win), [1, 0, 0, 1])
+    
+    def test_win_rate(self) -> None:
+        self.assertEqual(self.batch.win_rate(), 50.0)
+        self.assertEqual(self.batch.win_rate(10), 50.0)
+        self.assertEqual(self.batch.win_rate(30), 100.0)
+        self.assertEqual(self.batch.win_rate(99), 0)
+        self.assertEqual(self.batch.win_rate_by_champ(), {10: 50.0, 20: 0.0, 30: 100.0})
+    
+    def test_kda_by_champ(self) -> None:
+        kda = self.batch.kda_by_champ()
+        # champion 10 is summed over both games before dividing: (5 + 2 + 3 + 4) / (2 + 3)
+        self.assertAlmostEqual(kda[10], 14 / 5)
+        self.assertAlmostEqual(kda[20], 2 / 4)
+        # no deaths reports 0, same as ChampionStats.kda
+        self.assertEqual(kda[30], 0)
+    
+    def test_empty_payload(self) -> None:
+        batch = GameBatch.from_games([])
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.win_rate(), 0)
+        self.assertEqual(batch.kda_by_champ(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+# Add module to path to reference opgg subdir from here.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from opgg.utils import Utils, _ttl_cache
+
+
+class TTLCacheTests(unittest.TestCase):
+    """
+    Offline tests for the `_ttl_cache` memoization behind `get_all_champions` / `get_all_seasons`
+    """
+    
+    def setUp(self) -> None:
+        self._ttl, self._maxsize = Utils.cache_ttl, Utils.cache_maxsize
+        self.calls = []
+        
+        @_ttl_cache
+        def fetch(name, page_props=None):
+            self.calls.append(name)
+            return [name]
+        
+        self.fetch = fetch
+    
+    def tearDown(self) -> None:
+        Utils.cache_ttl, Utils.cache_maxsize = self._ttl, self._maxsize
+    
+    def test_hit_within_ttl(self) -> None:
+        self.assertEqual(self.fetch("a"), ["a"])
+        self.assertEqual(self.fetch("a"), ["a"])
+        self.assertEqual(self.calls, ["a"])
+    
+    def test_expired_entry_is_refetched(self) -> None:
+        Utils.cache_ttl = 10
+        with mock.patch("opgg.utils.time.monotonic", return_value=100.0):
+            self.fetch("a")
+        with mock.patch("opgg.utils.time.monotonic", return_value=111.0):
+            self.fetch("a")
+        self.assertEqual(self.calls, ["a", "a"])
+    
+    def test_expired_entries_are_evicted_on_insert(self) -> None:
+        Utils.cache_ttl = 10
+        with mock.patch("opgg.utils.time.monotonic", return_value=100.0):
+            self.fetch("a")
+        with mock.patch("opgg.utils.time.monotonic", return_value=111.0):
+            self.fetch("b")
+        # "a" expired and was dropped when "b" went in, so it must be fetched again even with the clock turned back
+        with mock.patch("opgg.utils.time.monotonic", return_value=105.0):
+            self.fetch("a")
+        self.assertEqual(self.calls, ["a", "b", "a"])
+    
+    def test_least_recently_used_is_dropped_past_maxsize(self) -> None:
+        Utils.cache_maxsize = 2
+        self.fetch("a")
+        self.fetch("b")
+        self.fetch("a")  # "b" is now the least recently used
+        self.fetch("c")
+        self.fetch("a")
+        self.fetch("b")
+        self.assertEqual(self.calls, ["a", "b", "c", "b"])
+    
+    def test_callers_get_a_copy(self) -> None:
+        first = self.fetch("a")
+        first.append("mutated")
+        self.assertEqual(self.fetch("a"), ["a"])
+        self.assertIsNot(self.fetch("a"), self.fetch("a"))
+    
+    def test_shared_returns_the_cached_object(self) -> None:
+        self.assertIs(self.fetch.shared("a"), self.fetch.shared("a"))
+        self.assertEqual(self.fetch("a"), self.fetch.shared("a"))
+        self.assertEqual(self.calls, ["a"])
+    
+    def test_page_props_calls_are_not_cached(self) -> None:
+        self.fetch("a", page_props={})
+        self.fetch("a", page_props={})
+        self.assertEqual(self.calls, ["a", "a"])
+    
+    def test_cache_clear(self) -> None:
+        self.fetch("a")
+        self.fetch.cache_clear()
+        self.fetch("a")
+        self.assertEqual(self.calls, ["a", "a"])
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+    
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeSession:
+    """
+    Stand-in for `requests.Session`, hands out the given responses in order and records every request.
+    """
+    def __init__(self, *responses: _FakeResponse) -> None:
+        self.headers = {}
+        self.responses = list(responses)
+        self.calls = []
+    
+    def request(self, method: str, url: str, **kwargs) -> _FakeResponse:
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+
+class RequestRetryTests(unittest.TestCase):
+    """
+    Offline tests for the 429/5xx retry and backoff of `Utils.request`
+    """
+    
+    def setUp(self) -> None:
+        self._session, self._max_retries = Utils._session, Utils.max_retries
+        Utils.max_retries = 3
+        
+        sleep = mock.patch("opgg.utils.time.sleep")
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+    
+    def tearDown(self) -> None:
+        Utils._session, Utils.max_retries = self._session, self._max_retries
+    
+    def _request(self, *responses: _FakeResponse) -> tuple[_FakeResponse, _FakeSession]:
+        session = _FakeSession(*responses)
+        Utils.set_session(session)
+        return Utils.request("GET", "https://example.invalid/api", params={"a": 1}), session
+    
+    def _delays(self) -> list[float]:
+        return [call.args[0] for call in self.sleep.call_args_list]
+    
+    def test_success_is_not_retried(self) -> None:
+        res, session = self._request(_FakeResponse(200))
+        
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(session.calls, [("GET", "https://example.invalid/api", {"params": {"a": 1}})])
+        self.sleep.assert_not_called()
+    
+    def test_client_errors_are_not_retried(self) -> None:
+        res, session = self._request(_FakeResponse(404))
+        
+        self.assertEqual(res.status_code, 404)
+        self.assertEqual(len(session.calls), 1)
+    
+    def test_429_and_5xx_are_retried_with_exponential_backoff(self) -> None:
+        failed = [_FakeResponse(429), _FakeResponse(503), _FakeResponse(500)]
+        res, session = self._request(*failed, _FakeResponse(200))
+        
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(session.calls), 4)
+        self.assertEqual(self._delays(), [0.5, 1, 2])
+        # every discarded response is closed before retrying
+        self.assertTrue(all(response.closed for response in failed))
+        self.assertFalse(res.closed)
+    
+    def test_last_failure_is_returned_once_retries_are_used_up(self) -> None:
+        res, session = self._request(*[_FakeResponse(503) for _ in range(4)])
+        
+        self.assertEqual(res.status_code, 503)
+        self.assertEqual(len(session.calls), Utils.max_retries + 1)
+        self.assertEqual(len(self._delays()), Utils.max_retries)
+        self.assertFalse(res.closed)
+    
+    def test_retry_after_seconds(self) -> None:
+        self._request(_FakeResponse(429, {"Retry-After": "7"}), _FakeResponse(200))
+        self.assertEqual(self._delays(), [7])
+    
+    def test_retry_after_http_date(self) -> None:
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True)
+        self._request(_FakeResponse(429, {"Retry-After": retry_at}), _FakeResponse(200))
+        
+        (delay,) = self._delays()
+        self.assertTrue(8 <= delay <= 10, delay)
+    
+    def test_retry_after_is_capped_at_30_seconds(self) -> None:
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(hours=1), usegmt=True)
+        self._request(
+            _FakeResponse(429, {"Retry-After": "120"}), _FakeResponse(429, {"Retry-After": retry_at}), _FakeResponse(200)
+        )
+        self.assertEqual(self._delays(), [30, 30])
+    
+    def test_invalid_retry_after_falls_back_to_backoff(self) -> None:
+        self._request(_FakeResponse(503, {"Retry-After": "soon"}), _FakeResponse(200))
+        self.assertEqual(self._delays(), [0.5])
+
+
+if __name__ == "__main__":
+    unittest.main()